@@ -0,0 +1,55 @@
+"""
+🏗️ Compilador del archivo .env
+
+Lee el .env de la raíz del proyecto una sola vez y genera src/env_cache.py,
+un módulo Python que solo hace os.environ.setdefault(...) por cada variable.
+Importar ese módulo es mucho más rápido que volver a parsear el .env con
+python-dotenv en cada arranque del servidor.
+
+Uso (desde la raíz del proyecto):
+    poetry run python scripts/compile_env.py
+
+⚠️ El módulo generado contiene tus secretos (p.ej. YOUTUBE_API_KEY): está en
+.gitignore y NUNCA debe subirse al repositorio. Si cambias el .env, vuelve a
+ejecutar este script (o borra src/env_cache.py para volver a usar dotenv).
+"""
+
+from pathlib import Path
+from dotenv import dotenv_values
+
+# 📂 Rutas del proyecto (desde scripts/ -> raíz/)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ENV_PATH = PROJECT_ROOT / ".env"
+OUTPUT_PATH = PROJECT_ROOT / "src" / "env_cache.py"
+
+HEADER = '''"""
+🗃️ Variables de entorno precompiladas desde .env
+
+⚠️ Archivo generado automáticamente por scripts/compile_env.py.
+Contiene secretos: no lo edites a mano ni lo subas al repositorio.
+"""
+
+import os
+
+'''
+
+
+def main() -> None:
+    """🚀 Genera src/env_cache.py a partir del .env."""
+    if not ENV_PATH.exists():
+        print(f"⚠ Warning: No .env found at: {ENV_PATH}")
+        return
+
+    lines = [HEADER]
+    for key, value in dotenv_values(ENV_PATH).items():
+        if value is None:
+            continue
+        # 🔒 setdefault: las variables reales del entorno siempre tienen prioridad
+        lines.append(f"os.environ.setdefault({key!r}, {value!r})\n")
+
+    OUTPUT_PATH.write_text("".join(lines), encoding="utf-8")
+    print(f"✅ Env cache written to: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+🏗️ Generador de la caché de iconos
+
+Recorre assets/icons/*.png, codifica cada icono en base64 y genera el módulo
+src/utils/icons_cache.py con los data URIs ya calculados. Así el servidor no
+tiene que leer ni codificar los PNG en cada arranque.
+
+Uso (desde la raíz del proyecto):
+    poetry run python scripts/generate_icons_cache.py
+
+💡 Vuelve a ejecutarlo cada vez que añadas o modifiques un icono.
+"""
+
+from pathlib import Path
+
+# 🚀 Codificador SIMD si está disponible, si no el de la librería estándar
+try:
+    from pybase64 import standard_b64encode
+except ImportError:
+    from base64 import standard_b64encode
+
+# 📂 Rutas del proyecto (desde scripts/ -> raíz/)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ICONS_DIR = PROJECT_ROOT / "assets" / "icons"
+OUTPUT_PATH = PROJECT_ROOT / "src" / "utils" / "icons_cache.py"
+
+HEADER = '''"""
+🗃️ Caché precalculada de iconos (data URIs en base64)
+
+⚠️ Archivo generado automáticamente por scripts/generate_icons_cache.py.
+No lo edites a mano: vuelve a ejecutar el script si cambian los iconos.
+"""
+
+ICONS = {
+'''
+
+
+def main() -> None:
+    """🚀 Genera src/utils/icons_cache.py a partir de assets/icons/*.png."""
+    lines = [HEADER]
+    for icon_path in sorted(ICONS_DIR.glob("*.png")):
+        # 🔐 Codificamos una única vez, en tiempo de build
+        icon_data_uri = (b"data:image/png;base64," +
+                         standard_b64encode(icon_path.read_bytes())).decode("ascii")
+        lines.append(f'    "{icon_path.name}": "{icon_data_uri}",\n')
+        print(f"🖼️ Icon cached: {icon_path.name}")
+    lines.append("}\n")
+
+    OUTPUT_PATH.write_text("".join(lines), encoding="utf-8")
+    print(f"✅ Cache written to: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
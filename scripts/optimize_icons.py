@@ -0,0 +1,53 @@
+"""
+🗜️ Optimizador de iconos
+
+Comprime los PNG de assets/icons/ con pngquant (con pérdida, paleta reducida)
+y oxipng (sin pérdida) y después regenera src/utils/icons_cache.py.
+Cuantos menos bytes tenga cada PNG, menos ocupa su data URI en base64
+(un 33% más que el archivo original) tanto en memoria como en la caché.
+
+Uso (desde la raíz del proyecto):
+    poetry run python scripts/optimize_icons.py
+
+💡 Necesitas tener instalados pngquant y/o oxipng en el PATH; si alguno no
+está disponible, simplemente se omite ese paso.
+"""
+
+import shutil
+import subprocess
+
+from generate_icons_cache import ICONS_DIR, main as generate_icons_cache
+
+
+def main() -> None:
+    """🚀 Optimiza los iconos y regenera la caché de data URIs."""
+    icon_paths = sorted(str(p) for p in ICONS_DIR.glob("*.png"))
+    if not icon_paths:
+        print(f"⚠ Warning: No icons found in: {ICONS_DIR}")
+        return
+
+    # 🎨 pngquant: reduce la paleta; sobrescribe solo si el resultado es menor
+    if shutil.which("pngquant"):
+        subprocess.run(
+            ["pngquant", "--quality=65-80", "--skip-if-larger", "--force",
+             "--ext", ".png", *icon_paths],
+            check=False  # Sale con código != 0 si algún icono no mejora
+        )
+    else:
+        print("⚠ Warning: pngquant not found, skipping lossy compression")
+
+    # 🔧 oxipng: recomprime sin pérdida y elimina metadatos
+    if shutil.which("oxipng"):
+        subprocess.run(
+            ["oxipng", "-o", "max", "--strip", "safe", *icon_paths],
+            check=True
+        )
+    else:
+        print("⚠ Warning: oxipng not found, skipping lossless compression")
+
+    # 🗃️ Regeneramos la caché con los iconos ya optimizados
+    generate_icons_cache()
+
+
+if __name__ == "__main__":
+    main()
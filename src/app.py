@@ -31,6 +31,17 @@ mcp.mount(elicitation_mcp_demo)
 # 🎬 Punto de entrada de la aplicación
 # Solo se ejecuta cuando corremos este archivo directamente (no cuando se importa)
 if __name__ == "__main__":
-    # 🌐 Iniciamos el servidor en modo HTTP en el puerto 8000
-    # Puedes acceder al servidor en: http://localhost:8000
-    mcp.run(transport="http", port=8000)
+    # ⚡ Si uvloop está instalado (extra "speedups", no disponible en Windows)
+    # lo usamos como event loop: es más rápido que el de asyncio por defecto
+    try:
+        import asyncio
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    # 🌐 Iniciamos el servidor con el transporte Streamable HTTP en el puerto 8000
+    # Es el transporte recomendado por la especificación MCP para servidores
+    # remotos: mantiene la sesión entre llamadas y permite respuestas en streaming
+    # Puedes acceder al servidor en: http://localhost:8000/mcp
+    mcp.run(transport="streamable-http", port=8000)
@@ -1,4 +1,44 @@
 """Services package for YouTube MCP Server."""
-from .youtube_service import YouTubeService, YouTubeConfig
+from .youtube_service import (
+    YouTubeService,
+    YouTubeConfig,
+    AsyncYouTubeService,
+    YouTubeBatch,
+    ChannelNotFoundError,
+    get_service,
+    get_youtube_service,
+    VideoResult,
+    SearchVideoResult,
+    VideoDetailsResult,
+    ChannelResult,
+    ErrorResponse,
+    SearchVideosResponse,
+    ChannelIdsResponse,
+    ChannelsDetailsResponse,
+    SearchChannelsResponse,
+    VideosDetailsResponse,
+    VideoDetailsResponse,
+    ChannelVideosResponse,
+)
 
-__all__ = ['YouTubeService', 'YouTubeConfig']
+__all__ = [
+    'YouTubeService',
+    'YouTubeConfig',
+    'AsyncYouTubeService',
+    'YouTubeBatch',
+    'ChannelNotFoundError',
+    'get_service',
+    'get_youtube_service',
+    'VideoResult',
+    'SearchVideoResult',
+    'VideoDetailsResult',
+    'ChannelResult',
+    'ErrorResponse',
+    'SearchVideosResponse',
+    'ChannelIdsResponse',
+    'ChannelsDetailsResponse',
+    'SearchChannelsResponse',
+    'VideosDetailsResponse',
+    'VideoDetailsResponse',
+    'ChannelVideosResponse',
+]
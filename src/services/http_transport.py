@@ -0,0 +1,94 @@
+"""🌐 Transporte HTTP/2 para googleapiclient
+
+googleapiclient habla con la API a través de un objeto "tipo httplib2"
+(cualquier cosa con un método ``request()`` que devuelva ``(respuesta, contenido)``).
+httplib2 solo sabe HTTP/1.1 y no es thread-safe, así que cada hilo necesita
+su propia conexión y las peticiones simultáneas no comparten nada.
+
+Este módulo adapta ``httpx.Client(http2=True)`` a esa interfaz: un único
+cliente (thread-safe) para todo el proceso que multiplexa todas las
+peticiones a googleapis.com sobre una sola conexión TCP+TLS.
+
+📦 httpx ya viene con fastmcp; HTTP/2 necesita además el paquete ``h2``
+(extra ``speedups``). Si no está instalado, se sigue usando httplib2.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+class Http2Transport:
+    """🌐 Objeto compatible con ``httplib2.Http`` que usa ``httpx`` con HTTP/2.
+
+    Ejemplo:
+        >>> http = Http2Transport(timeout=10)
+        >>> client = build_from_document(document, developerKey=key, http=http)
+    """
+
+    def __init__(self, timeout: float = 10):
+        import httpx
+
+        self.timeout = timeout
+        self._client = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            follow_redirects=True,  # 🔀 Igual que httplib2
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+
+    def request(
+        self,
+        uri: str,
+        method: str = 'GET',
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = 5,
+        connection_type: Any = None
+    ) -> Tuple[Any, bytes]:
+        """🚀 Envía la petición con la misma firma y resultado que ``httplib2.Http.request``.
+
+        Raises:
+            TimeoutError: ⏱️ Si la petición supera el timeout
+            ConnectionError: 🔌 Si falla la conexión
+
+        Son las excepciones que googleapiclient sabe reintentar (``num_retries``).
+        """
+        import httpx
+        import httplib2
+
+        try:
+            response = self._client.request(method, uri, content=body, headers=headers)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+
+        info = dict(response.headers)
+        # 🗜️ httpx ya ha descomprimido el contenido; httplib2 hace lo mismo
+        # y renombra la cabecera para que nadie intente descomprimirlo otra vez
+        if 'content-encoding' in info:
+            info['-content-encoding'] = info.pop('content-encoding')
+        info['status'] = str(response.status_code)
+        info['reason'] = response.reason_phrase
+        return httplib2.Response(info), response.content
+
+    def close(self) -> None:
+        """🔒 Cierra las conexiones abiertas."""
+        self._client.close()
+
+
+@lru_cache(maxsize=None)
+def http2_available() -> bool:
+    """🔎 ¿Están instalados httpx y h2 (necesario para HTTP/2)?"""
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def shared_http2_transport(timeout: float) -> Http2Transport:
+    """♻️ Transporte HTTP/2 único por proceso (por timeout), compartido por todos los hilos."""
+    return Http2Transport(timeout=timeout)
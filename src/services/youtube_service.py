@@ -9,27 +9,397 @@ consistente y manejando errores apropiadamente.
 - Manejo de errores robusto con try/except
 - Métodos reutilizables para diferentes operaciones de YouTube
 - Uso de dataclasses para configuración tipada
+- Versión async (AsyncYouTubeService) para no bloquear el event loop de FastMCP
+- Control local de la cuota de la API (ver utils/quota.py)
 """
 
+import asyncio
+import json
+import logging
 import os
-from typing import Optional, Dict, List, Any
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import (
+    Optional, Dict, List, Any, Callable, Iterator, Literal, Tuple,
+    TypedDict, TypeVar, Union
+)
+from googleapiclient.errors import Error as GoogleApiError, HttpError
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from utils.cache import TTLCache
+from utils.disk_cache import DiskCache
+from utils.quota import QuotaExceededError, QuotaLimiter
+from .http_transport import http2_available, shared_http2_transport
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# 📦 Máximo de IDs que aceptan videos.list y channels.list en una sola llamada
+_MAX_IDS_PER_REQUEST = 50
+
+# 🧩 Valores "part" de cada llamada (constantes: no se reconstruyen en cada búsqueda)
+_SEARCH_PART = 'id,snippet'
+_SEARCH_IDS_PART = 'id'
+_CHANNELS_DETAILS_PART = 'snippet,statistics,brandingSettings,contentDetails'
+_VIDEOS_DETAILS_PART = 'snippet,contentDetails,statistics'
+_UPLOADS_PLAYLIST_PART = 'contentDetails'
+_PLAYLIST_ITEMS_PART = 'snippet,contentDetails'
+
+# ✂️ Máscaras "fields": pedimos a la API SOLO los campos que usamos.
+# Las respuestas pesan mucho menos (sin todas las miniaturas, traducciones, etc.)
+_SEARCH_VIDEOS_FIELDS = (
+    'nextPageToken,'
+    'items(id/videoId,'
+    'snippet(title,description,channelTitle,publishedAt,thumbnails/default/url))'
+)
+_SEARCH_CHANNEL_IDS_FIELDS = 'items/id/channelId'
+_CHANNELS_DETAILS_FIELDS = (
+    'items(id,'
+    'snippet(title,description,publishedAt,thumbnails/default/url),'
+    'statistics(subscriberCount,videoCount,viewCount),'
+    'brandingSettings/channel/country,'
+    'contentDetails/relatedPlaylists/uploads)'
+)
+_VIDEOS_DETAILS_FIELDS = (
+    'items(id,'
+    'snippet(title,description,channelId,channelTitle,publishedAt,thumbnails/default/url),'
+    'contentDetails/duration,'
+    'statistics(viewCount,likeCount,commentCount))'
+)
+_CHANNEL_LATEST_VIDEOS_FIELDS = (
+    'nextPageToken,'
+    'items(id/videoId,'
+    'snippet(title,description,publishedAt,thumbnails/default/url))'
+)
+_UPLOADS_PLAYLIST_FIELDS = 'items(id,contentDetails/relatedPlaylists/uploads)'
+_PLAYLIST_ITEMS_FIELDS = (
+    'nextPageToken,'
+    'items(snippet(title,description,publishedAt,thumbnails/default/url,resourceId/videoId),'
+    'contentDetails/videoPublishedAt)'
+)
+
+# ⏱️ Tiempo de vida (segundos) de las cachés del servicio
+# Los detalles incluyen estadísticas (vistas, suscriptores...) que cambian rápido
+_DETAILS_CACHE_TTL = 60
+_LATEST_VIDEOS_CACHE_TTL = 300
+
+# 💽 Los IDs de las playlists de uploads no cambian nunca: se guardan en disco
+# para no volver a pedirlos tras reiniciar el servidor.
+# La carpeta se puede cambiar con YOUTUBE_MCP_CACHE_DIR.
+def _uploads_cache_path() -> str:
+    """📂 Ruta de la caché de uploads (se lee al primer uso, ya cargado el .env)."""
+    return os.path.join(
+        os.getenv('YOUTUBE_MCP_CACHE_DIR', '~/.cache/youtube_mcp'),
+        'uploads_playlists.db'
+    )
+
+
+_UPLOADS_DISK_CACHE = DiskCache(_uploads_cache_path)
+
+# 🧱 Parámetros fijos de search_videos (solo lectura); en cada llamada solo
+# añadimos la query, el número de resultados y el orden
+_SEARCH_VIDEOS_PARAMS = MappingProxyType({
+    'part': _SEARCH_PART,  # 📦 Pedimos ID y datos básicos (snippet)
+    'fields': _SEARCH_VIDEOS_FIELDS,  # ✂️ Solo los campos que usamos
+    'type': 'video'  # 🎬 Solo buscamos videos (no canales ni playlists)
+})
+
+# 📦 Máximo de sub-peticiones por batch (más provoca errores servingLimitExceeded)
+_MAX_BATCH_SIZE = 50
+
+# 💰 Unidades de cuota que gasta cada llamada (ver la documentación de la API)
+_QUOTA_COST = MappingProxyType({
+    'search': 100,
+    'videos': 1,
+    'channels': 1,
+    'playlist_items': 1,
+})
+
+# 🔁 Reintentos (con espera exponencial) de googleapiclient ante 429, 5xx
+# y 403 rateLimitExceeded
+_NUM_RETRIES = 3
+
+# 🔁 Motivos de un 403 que son transitorios y se reintentan (como en googleapiclient)
+_RETRYABLE_403_REASONS = (b'rateLimitExceeded', b'userRateLimitExceeded')
+
+_T = TypeVar('_T')
+
+# 🔗 Prefijos de las URLs públicas (``prefijo + id`` es más rápido que un f-string)
+_WATCH_URL = 'https://www.youtube.com/watch?v='
+_CHANNEL_URL = 'https://www.youtube.com/channel/'
+
+# ⚡ Extractores de campos para los bucles que recorren cada item de la respuesta.
+# itemgetter hace todas las búsquedas de una vez (en C) y devuelve una tupla.
+_get_snippet = itemgetter('snippet')
+_get_video_id = itemgetter('videoId')
+_search_video_fields = itemgetter('title', 'description', 'channelTitle', 'publishedAt')
+_channel_video_fields = itemgetter('title', 'description', 'publishedAt')
+_channel_details_fields = itemgetter('title', 'description', 'publishedAt')
+_video_details_fields = itemgetter(
+    'title', 'description', 'channelId', 'channelTitle', 'publishedAt')
+
+
+def _default_thumbnail(snippet: Dict[str, Any]) -> str:
+    """🖼️ URL de la miniatura por defecto ('' si el item no tiene, p.ej. videos privados).
+
+    try/except es más rápido que encadenar ``.get(..., {})`` cuando la clave
+    casi siempre existe, como aquí.
+    """
+    try:
+        return snippet['thumbnails']['default']['url']
+    except KeyError:
+        return ''
+
+
+def _latest_videos_key(channel_id: str, max_results: int, fast: bool) -> tuple:
+    """🔑 Clave de la caché de últimos videos (la misma para uno o varios canales).
+
+    ``fast`` forma parte de la clave: search.list (orden por fecha de la
+    búsqueda, lista vacía si el canal no existe) y la playlist de uploads
+    (``ChannelNotFoundError``) no devuelven lo mismo.
+    """
+    return (channel_id, max_results, fast)
+
+
+# 📐 Esquemas de los resultados
+# TypedDict documenta (y permite a los type checkers validar) las claves exactas
+# de cada dict, sin coste en tiempo de ejecución: siguen siendo dicts normales,
+# que es lo que FastMCP serializa y lo que comparten las cachés.
+class VideoResult(TypedDict):
+    """📹 Video tal y como lo devuelve get_channel_latest_videos."""
+    video_id: str
+    title: str
+    description: str
+    url: str
+    thumbnail: str
+    published_at: str
+
+
+class SearchVideoResult(VideoResult):
+    """🔍 Video de search_videos (incluye el canal de origen)."""
+    channel_title: str
+
+
+class VideoDetailsResult(SearchVideoResult):
+    """🎞️ Video de get_videos_details (con duración y estadísticas)."""
+    channel_id: str
+    duration: str
+    view_count: int
+    like_count: int
+    comment_count: int
+
+
+class ChannelResult(TypedDict):
+    """📺 Canal de search_channels / get_channels_details."""
+    channel_id: str
+    title: str
+    description: str
+    url: str
+    thumbnail: str
+    published_at: str
+    subscriber_count: int
+    video_count: int
+    view_count: int
+    country: str
+
+
+# 📦 Resultados de los métodos públicos: con ``success`` como Literal, un
+# ``if not result['success']`` separa el caso de éxito del de error
+class _ErrorResponseBase(TypedDict):
+    success: Literal[False]
+    error: str  # ❌ Mensaje descriptivo del error
+
+
+class ErrorResponse(_ErrorResponseBase, total=False):
+    """❌ Resultado de cualquier método cuando la llamada falla (ver ``_error``)."""
+    query: str  # 🔎 Solo en search_videos
+
+
+class SearchVideosResponse(TypedDict):
+    """🔍 Resultado de search_videos."""
+    success: Literal[True]
+    query: str
+    total_results: int
+    videos: List[SearchVideoResult]
+
+
+class ChannelIdsResponse(TypedDict):
+    """🆔 Resultado de search_channel_ids."""
+    success: Literal[True]
+    query: str
+    channel_ids: List[str]
+
+
+class ChannelsDetailsResponse(TypedDict):
+    """📊 Resultado de get_channels_details."""
+    success: Literal[True]
+    total_results: int
+    channels: List[ChannelResult]
+
+
+class SearchChannelsResponse(ChannelsDetailsResponse):
+    """📺 Resultado de search_channels."""
+    query: str
+
+
+class VideosDetailsResponse(TypedDict):
+    """🎞️ Resultado de get_videos_details (videos por ID)."""
+    success: Literal[True]
+    total_results: int
+    videos: Dict[str, VideoDetailsResult]
+
+
+class VideoDetailsResponse(TypedDict):
+    """🎞️ Resultado de get_video_details."""
+    success: Literal[True]
+    video: VideoDetailsResult
+
+
+class ChannelVideosResponse(TypedDict):
+    """📹 Resultado de get_channel_latest_videos."""
+    success: Literal[True]
+    channel_id: str
+    total_results: int
+    videos: List[VideoResult]
+
+
+class ChannelNotFoundError(LookupError):
+    """🔎 El canal pedido no existe (la API no devuelve su playlist de uploads)."""
+
+    def __init__(self, channel_id: str):
+        super().__init__(f'Canal no encontrado: {channel_id}')
+        self.channel_id = channel_id
+
+
+@lru_cache(maxsize=None)
+def _expected_errors() -> tuple:
+    """🎯 Excepciones que los métodos del servicio convierten en un dict de error.
+
+    Son las que puede provocar una llamada a la API: errores de googleapiclient,
+    de httplib2 (p.ej. DNS), cuota agotada (``QuotaExceededError``),
+    de red/timeout (``OSError``), respuestas que no son JSON
+    (``json.JSONDecodeError``, también la de orjson) y canales que no existen
+    (``ChannelNotFoundError``). Cualquier otra cosa (p.ej. un ``KeyError`` al
+    leer la respuesta) es un bug y no debe quedar oculta tras un "Error inesperado".
+
+    Es una función (cacheada) para que httplib2 solo se importe al usarse.
+    """
+    import httplib2
+    return (GoogleApiError, httplib2.HttpLib2Error, QuotaExceededError,
+            ChannelNotFoundError, OSError, json.JSONDecodeError)
+
+
+def _error(e: BaseException, query: Optional[str] = None) -> ErrorResponse:
+    """❌ Construye el dict de error que devuelven los métodos del servicio."""
+    if isinstance(e, HttpError):
+        body = e.content.decode('utf-8', errors='replace') if e.content else ''
+        message = f'Error de API de YouTube: {e.resp.status} - {body}'
+    elif isinstance(e, (QuotaExceededError, ChannelNotFoundError)):
+        message = str(e)
+    else:
+        message = f'Error inesperado: {e}'
+    error: ErrorResponse = {'success': False, 'error': message}
+    if query is not None:
+        error['query'] = query
+    return error
+
+
+def _is_quota_exceeded(e: HttpError) -> bool:
+    """🚫 ¿La API ha respondido que la cuota del día está agotada?"""
+    return e.resp.status == 403 and b'quotaExceeded' in (e.content or b'')
+
+
+def _is_retryable(e: HttpError) -> bool:
+    """🔁 ¿Es un error transitorio que merece reintentarse (429, 5xx, rateLimitExceeded)?"""
+    status = e.resp.status
+    if status == 403:
+        content = e.content or b''
+        return any(reason in content for reason in _RETRYABLE_403_REASONS)
+    return status == 429 or status >= 500
+
+
+@lru_cache(maxsize=None)
+def _discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """📄 Documento de discovery de la API, leído y parseado una sola vez por proceso.
+
+    googleapiclient incluye los documentos de discovery de sus APIs dentro del
+    paquete. Lo leemos y parseamos una vez y todos los clientes (uno por hilo)
+    reutilizan el mismo dict: ``build_from_document`` no vuelve a hacer
+    ``json.loads`` del documento entero cada vez que se construye uno.
+
+    Returns:
+        El documento ya parseado, o None si la librería no lo incluye.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    document = get_static_doc(service_name, version)
+    return json.loads(document) if document is not None else None
+
+
+@lru_cache(maxsize=None)
+def _json_model():
+    """🚀 Modelo JSON para googleapiclient que parsea las respuestas con orjson.
+
+    googleapiclient usa el módulo ``json`` de la librería estándar para leer
+    cada respuesta. Si ``orjson`` está instalado (extra "speedups"), usamos un
+    ``JsonModel`` que parsea con orjson (unas 3 veces más rápido). Si no está,
+    devolvemos None y la librería usa su modelo por defecto.
+
+    El modelo no guarda estado, así que todos los clientes comparten la misma
+    instancia.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    from googleapiclient.model import JsonModel
+
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # 🛟 Respuesta que no es JSON: dejamos que la librería la trate
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+
+    return OrjsonModel()
+
+
+@dataclass(frozen=True, slots=True)
 class YouTubeConfig:
     """🔧 Configuración para el servicio de YouTube API.
 
     Usa dataclass para crear una clase simple que almacena la configuración.
     Es como un "contenedor" de datos con valores por defecto.
+
+    🧊 Es inmutable (``frozen``) y por tanto hashable: se usa como clave para
+    compartir clientes entre servicios con la misma configuración
+    (ver ``_build_client``). ``slots`` evita el ``__dict__`` por instancia.
     """
     api_key: str  # 🔑 La clave API obtenida de Google Cloud Console
     # 📺 Nombre del servicio (siempre 'youtube')
     api_service_name: str = "youtube"
     api_version: str = "v3"  # 📌 Versión de la API (v3 es la actual)
+    timeout: float = 10  # ⏱️ Timeout (segundos) de cada petición HTTP
+    daily_quota: int = 10000  # 💰 Unidades de cuota diarias del proyecto
+    requests_per_second: float = 50  # 🚦 Máximo de peticiones por segundo
+
+    def __post_init__(self):
+        """🛡️ Valida los límites: con menos cuota no cabría ni una búsqueda."""
+        min_quota = max(_QUOTA_COST.values())
+        if self.daily_quota < min_quota:
+            raise ValueError(
+                f'daily_quota debe ser al menos {min_quota} '
+                f'(lo que cuesta una búsqueda), no {self.daily_quota}'
+            )
+        if self.requests_per_second < 1:
+            raise ValueError(
+                f'requests_per_second debe ser al menos 1, no {self.requests_per_second}'
+            )
 
     @classmethod
     def from_env(cls) -> 'YouTubeConfig':
@@ -40,7 +410,13 @@ class YouTubeConfig:
         """
         # Aseguramos que el .env esté cargado incluso si la app
         # no llamó a load_dotenv() antes de importar este módulo.
-        load_dotenv()
+        # ⚡ Si existe src/env_cache.py (generado con scripts/compile_env.py)
+        # lo importamos y nos ahorramos parsear el .env con python-dotenv.
+        try:
+            import env_cache  # noqa: F401
+        except ImportError:
+            from dotenv import load_dotenv
+            load_dotenv()
         api_key = os.getenv("YOUTUBE_API_KEY", "")
         if not api_key:
             raise ValueError(
@@ -51,6 +427,202 @@ class YouTubeConfig:
         return cls(api_key=api_key)
 
 
+# 🧵 Clientes ya construidos, por hilo: httplib2 (el transporte de
+# googleapiclient) no es thread-safe y las tools async llaman al servicio desde
+# hilos de trabajo con asyncio.to_thread()
+_thread_clients = threading.local()
+
+# 🔒 googleapiclient completa en el sitio las descripciones de los métodos del
+# documento de discovery (compartido) al crear cada recurso; construimos los
+# clientes de uno en uno para que dos hilos no lo modifiquen a la vez
+_client_build_lock = threading.RLock()
+
+
+def _build_client(config: YouTubeConfig):
+    """🔌 Devuelve el cliente de la API para ``config`` en el hilo actual.
+
+    Se construye una sola vez por hilo y configuración: varias instancias de
+    YouTubeService con la misma API key (p.ej. una por petición) comparten
+    cliente, documento de discovery y conexión HTTP en lugar de crear uno cada una.
+    """
+    clients = getattr(_thread_clients, 'clients', None)
+    if clients is None:
+        clients = _thread_clients.clients = {}
+
+    client = clients.get(config)
+    if client is not None:
+        return client
+
+    with _client_build_lock:
+        from googleapiclient.discovery import build, build_from_document
+
+        if http2_available():
+            # 🌐 HTTP/2: un único transporte para todos los hilos (ver http_transport)
+            http = shared_http2_transport(config.timeout)
+        else:
+            import httplib2
+            http = httplib2.Http(timeout=config.timeout)
+        document = _discovery_document(
+            config.api_service_name, config.api_version)
+        if document is not None:
+            client = build_from_document(
+                document,
+                developerKey=config.api_key,
+                http=http,
+                model=_json_model()
+            )
+        else:
+            # 🌐 La librería no incluye este documento: lo descargamos
+            client = build(
+                config.api_service_name,
+                config.api_version,
+                developerKey=config.api_key,
+                http=http,
+                model=_json_model(),
+                cache_discovery=False,
+                static_discovery=False
+            )
+        clients[config] = client
+        return client
+
+
+# 🚦 API key -> (limitador, daily_quota, requests_per_second con que se creó)
+_quota_limiters: Dict[str, Tuple[QuotaLimiter, int, float]] = {}
+_quota_limiters_lock = threading.Lock()
+
+
+def _quota_limiter(config: YouTubeConfig) -> QuotaLimiter:
+    """🚦 Limitador de cuota compartido por todos los servicios con la misma API key.
+
+    La cuota es del proyecto de Google Cloud (de la key), no de cada instancia
+    de YouTubeService, así que la cuenta tiene que ser común aunque cambien los
+    límites de la configuración: mandan los de la primera configuración que
+    usó la key (si otra pide límites distintos, se avisa en el log).
+    """
+    with _quota_limiters_lock:
+        entry = _quota_limiters.get(config.api_key)
+        if entry is None:
+            limiter = QuotaLimiter(
+                daily_units=config.daily_quota,
+                requests_per_second=config.requests_per_second)
+            entry = _quota_limiters[config.api_key] = (
+                limiter, config.daily_quota, config.requests_per_second)
+        elif entry[1:] != (config.daily_quota, config.requests_per_second):
+            logger.warning(
+                "⚠ This API key already has quota limits (%s units/day, %s req/s); "
+                "ignoring %s units/day, %s req/s",
+                entry[1], entry[2], config.daily_quota, config.requests_per_second)
+        return entry[0]
+
+
+class _Endpoints:
+    """⚡ Métodos ``list`` de cada recurso de la API, obtenidos una sola vez.
+
+    ``client.search()`` crea un objeto ``Resource`` nuevo en cada llamada;
+    guardando ``client.search().list`` nos ahorramos ese trabajo (y la
+    cadena de atributos) en cada petición.
+    """
+
+    __slots__ = ('search', 'videos', 'channels', 'playlist_items')
+
+    def __init__(self, client):
+        self.search = client.search().list
+        self.videos = client.videos().list
+        self.channels = client.channels().list
+        self.playlist_items = client.playlistItems().list
+
+
+def _get_endpoints(config: YouTubeConfig) -> _Endpoints:
+    """⚡ Devuelve los ``_Endpoints`` del cliente de ``config`` en el hilo actual."""
+    endpoints = getattr(_thread_clients, 'endpoints', None)
+    if endpoints is None:
+        endpoints = _thread_clients.endpoints = {}
+
+    api = endpoints.get(config)
+    if api is None:
+        # 🔒 Crear los recursos también completa el documento de discovery
+        with _client_build_lock:
+            api = endpoints[config] = _Endpoints(_build_client(config))
+    return api
+
+
+class YouTubeBatch:
+    """📦 Acumula peticiones a la API y las envía juntas en un batch HTTP.
+
+    Envuelve ``BatchHttpRequest`` de googleapiclient: muchas peticiones
+    independientes viajan en una sola petición HTTP (una conexión, un viaje
+    de ida y vuelta). Cada ``max_size`` peticiones se envía el batch
+    automáticamente para no superar los límites del servidor.
+
+    Normalmente no se crea a mano: usa ``YouTubeService.batch()``.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_size: int = _MAX_BATCH_SIZE,
+        quota: Optional[QuotaLimiter] = None
+    ):
+        self._client = client
+        self._max_size = max_size
+        self._quota = quota
+        self._batch: Any = None  # BatchHttpRequest (se crea al añadir la primera)
+        self._size = 0
+
+    def add(
+        self,
+        request,
+        callback: Callable[[Optional[Dict[str, Any]], Optional[Exception]], None],
+        cost: int = 1
+    ) -> None:
+        """➕ Añade una petición al batch.
+
+        Args:
+            request: Petición sin ejecutar (ej: ``client.videos().list(...)``).
+            callback: Función ``callback(response, exception)`` que se llama
+                      con la respuesta (o la excepción) de esta petición.
+            cost: 💰 Unidades de cuota que gasta la petición.
+
+        Raises:
+            QuotaExceededError: 🚫 Si no quedan unidades de cuota
+        """
+        if self._quota is not None:
+            # 💰 Cada sub-petición del batch gasta su propia cuota
+            self._quota.acquire(cost)
+        if self._batch is None:
+            self._batch = self._client.new_batch_http_request()
+        self._batch.add(request, callback=self._on_response(request, callback))
+        self._size += 1
+        if self._size >= self._max_size:
+            self.execute()
+
+    def _on_response(self, request, callback):
+        """🎯 Callback para googleapiclient de una sub-petición del batch.
+
+        ``BatchHttpRequest`` no reintenta: si una sub-petición falla con un error
+        transitorio, la repetimos sola con los mismos reintentos que
+        ``YouTubeService._execute`` (sin volver a descontar su cuota). Si la API
+        responde que no queda cuota, se marca también en local.
+        """
+        def on_response(request_id, response, exception):
+            if isinstance(exception, HttpError) and _is_retryable(exception):
+                try:
+                    response, exception = request.execute(num_retries=_NUM_RETRIES), None
+                except _expected_errors() as e:
+                    response, exception = None, e
+            if (self._quota is not None and isinstance(exception, HttpError)
+                    and _is_quota_exceeded(exception)):
+                self._quota.exhaust()
+            callback(response, exception)
+        return on_response
+
+    def execute(self) -> None:
+        """🚀 Envía las peticiones pendientes (si hay alguna)."""
+        if self._batch is not None:
+            batch, self._batch, self._size = self._batch, None, 0
+            batch.execute()
+
+
 class YouTubeService:
     """🎬 Servicio para interactuar con la API de YouTube.
 
@@ -73,24 +645,65 @@ class YouTubeService:
             service = YouTubeService(config)
         """
         self.config = config or YouTubeConfig.from_env()
-        self._client = None
+        # 🚦 Cuenta local de la cuota (común a todos los servicios con esta key)
+        self._quota = _quota_limiter(self.config)
+        # 🧠 Cachés de consultas idempotentes (por ID): evitan repetir llamadas
+        # y gastar cuota cuando se piden los mismos videos/canales
+        self._video_cache = TTLCache(maxsize=1024, ttl=_DETAILS_CACHE_TTL)
+        self._channel_cache = TTLCache(maxsize=1024, ttl=_DETAILS_CACHE_TTL)
+        self._latest_videos_cache = TTLCache(
+            maxsize=1024, ttl=_LATEST_VIDEOS_CACHE_TTL)
+        # 📋 channel_id -> ID de su playlist de uploads (nunca cambia)
+        self._uploads_playlist_ids: Dict[str, str] = {}
+
+    def clear_cache(self) -> None:
+        """🗑️ Vacía todas las cachés del servicio (útil en tests)."""
+        self._video_cache.clear()
+        self._channel_cache.clear()
+        self._latest_videos_cache.clear()
 
     @property
     def client(self):
         """🔌 Cliente de la API de YouTube (lazy loading).
 
-        Lazy loading significa que el cliente solo se crea cuando se usa por primera vez.
-        Esto ahorra recursos si creamos el servicio pero no lo usamos inmediatamente.
+        El cliente solo se crea cuando se usa por primera vez, y una sola vez
+        por hilo y configuración (ver ``_build_client``): los servicios con la
+        misma configuración comparten el cliente del hilo actual.
 
-        💡 Patrón de diseño: Singleton + Lazy Initialization
+        - 📄 Se construye con ``build_from_document`` a partir del documento de
+          discovery empaquetado con la librería, leído y parseado una vez por proceso
+          (ver ``_discovery_document``). Solo si la librería no lo incluye se
+          descarga (``static_discovery=False``).
+        - 🔗 El transporte es una conexión HTTP/2 compartida por todos los hilos
+          si ``h2`` está instalado (ver ``http_transport``), o si no un
+          ``httplib2.Http`` por hilo con keep-alive.
+        - 🚀 Si orjson está disponible, las respuestas se parsean con él
+          (ver ``_json_model``).
         """
-        if self._client is None:
-            self._client = build(
-                self.config.api_service_name,
-                self.config.api_version,
-                developerKey=self.config.api_key
-            )
-        return self._client
+        return _build_client(self.config)
+
+    @property
+    def _api(self) -> _Endpoints:
+        """⚡ Métodos ``list`` ya creados del cliente de este hilo (ver ``_Endpoints``)."""
+        return _get_endpoints(self.config)
+
+    def _execute(self, request, cost: int) -> Dict[str, Any]:
+        """🚀 Ejecuta una petición descontando ``cost`` unidades de la cuota local.
+
+        Si la API responde que la cuota está agotada, se marca también en local
+        para que las siguientes llamadas fallen al momento sin gastar una petición.
+
+        Raises:
+            QuotaExceededError: 🚫 Si no quedan unidades de cuota
+            HttpError: ❌ Si hay un error en la llamada a la API de YouTube
+        """
+        self._quota.acquire(cost)
+        try:
+            return request.execute(num_retries=_NUM_RETRIES)
+        except HttpError as e:
+            if _is_quota_exceeded(e):
+                self._quota.exhaust()
+            raise
 
     def search_videos(
         self,
@@ -99,7 +712,7 @@ class YouTubeService:
         order: str = 'relevance',
         region_code: Optional[str] = None,
         language: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Union[SearchVideosResponse, ErrorResponse]:
         """🔍 Busca vídeos en YouTube basándose en una consulta.
 
         Args:
@@ -132,80 +745,114 @@ class YouTubeService:
             >>> print(f"Encontrados: {results['total_results']} videos")
         """
         try:
-            # 🎯 Configuramos los parámetros de búsqueda
-            search_params = {
-                'q': query,  # 🔎 Query de búsqueda
-                'part': 'id,snippet',  # 📦 Pedimos ID y datos básicos (snippet)
-                # 🛡️ Limitamos a 50 (límite de la API)
-                'maxResults': min(max_results, 50),
-                # � Solo buscamos videos (no canales ni playlists)
-                'type': 'video',
-                'order': order  # 📊 Orden de resultados
+            # 🛡️ Limitamos a 50 (límite de la API por página)
+            videos = list(self.iter_search_videos(
+                query,
+                max_results=min(max_results, 50),
+                order=order,
+                region_code=region_code,
+                language=language
+            ))
+
+            # ✅ Retornamos los resultados en un formato estructurado
+            return {
+                'success': True,
+                'query': query,
+                'total_results': len(videos),
+                'videos': videos
             }
 
-            # 🌍 Agregar filtro de región si se especificó
-            if region_code:
-                search_params['regionCode'] = region_code
+        except _expected_errors() as e:
+            # ❌ Error de la API (cuota excedida, credenciales inválidas...) o de red
+            return _error(e, query=query)
+
+    def iter_search_videos(
+        self,
+        query: str,
+        max_results: int = 5,
+        order: str = 'relevance',
+        region_code: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Iterator[SearchVideoResult]:
+        """🔁 Genera los vídeos de una búsqueda uno a uno, paginando si hace falta.
+
+        A diferencia de :meth:`search_videos`, no construye la lista completa:
+        quien lo consume puede parar en cuanto tenga lo que necesita (``break``)
+        y no se piden más páginas de las necesarias. Si ``max_results`` es mayor
+        que 50, sigue ``nextPageToken`` automáticamente.
+
+        Los parámetros son los mismos que en :meth:`search_videos`.
 
-            # 🗣️ Agregar preferencia de idioma si se especificó
-            if language:
-                search_params['relevanceLanguage'] = language
+        Raises:
+            HttpError: ❌ Si hay un error en la llamada a la API de YouTube
+
+        Ejemplo:
+            >>> for video in service.iter_search_videos("Python", max_results=100):
+            ...     if "FastMCP" in video['title']:
+            ...         break
+        """
+        # 🎯 Configuramos los parámetros de búsqueda
+        search_params: Dict[str, Any] = {
+            **_SEARCH_VIDEOS_PARAMS,
+            'q': query,  # 🔎 Query de búsqueda
+            'order': order  # 📊 Orden de resultados
+        }
+
+        # 🌍 Agregar filtro de región si se especificó
+        if region_code:
+            search_params['regionCode'] = region_code
+
+        # 🗣️ Agregar preferencia de idioma si se especificó
+        if language:
+            search_params['relevanceLanguage'] = language
+
+        remaining = max_results
+        while remaining > 0:
+            # 🛡️ Cada página admite como máximo 50 resultados
+            search_params['maxResults'] = min(remaining, 50)
 
             # 🚀 Ejecutamos la búsqueda en la API de YouTube
-            search_response = self.client.search().list(**search_params).execute()
+            search_response = self._execute(
+                self._api.search(**search_params), _QUOTA_COST['search'])
 
-            # 📝 Procesamos los resultados y los convertimos a un formato más amigable
-            videos = []
+            # 📝 Convertimos cada resultado a un formato más amigable
             for item in search_response.get('items', []):
-                video_id = item['id']['videoId']
-                video = {
+                snippet = _get_snippet(item)
+                video_id = _get_video_id(item['id'])
+                title, description, channel_title, published_at = _search_video_fields(snippet)
+                yield {
                     'video_id': video_id,  # 🆔 ID único del video
-                    'title': item['snippet']['title'],  # 📌 Título del video
+                    'title': title,  # 📌 Título del video
                     # 📄 Descripción
-                    'description': item['snippet']['description'],
+                    'description': description,
                     # 🔗 URL completa
-                    'url': f'https://www.youtube.com/watch?v={video_id}',
+                    'url': _WATCH_URL + video_id,
                     # 🖼️ Miniatura normal
-                    'thumbnail': item['snippet']['thumbnails']['default']['url'],
+                    'thumbnail': _default_thumbnail(snippet),
                     # 👤 Nombre del canal
-                    'channel_title': item['snippet']['channelTitle'],
+                    'channel_title': channel_title,
                     # 📅 Fecha de publicación
-                    'published_at': item['snippet']['publishedAt']
+                    'published_at': published_at
                 }
-                videos.append(video)
-
-            # ✅ Retornamos los resultados en un formato estructurado
-            return {
-                'success': True,
-                'query': query,
-                'total_results': len(videos),
-                'videos': videos
-            }
+                remaining -= 1
+                if remaining == 0:
+                    return
 
-        except HttpError as e:
-            # ❌ Error específico de la API de YouTube (cuota excedida, credenciales inválidas, etc.)
-            return {
-                'success': False,
-                'error': f'Error de API de YouTube: {e.resp.status} - {e.content.decode()}',
-                'query': query
-            }
-        except Exception as e:
-            # ⚠️ Cualquier otro error inesperado (red, timeout, etc.)
-            return {
-                'success': False,
-                'error': f'Error inesperado: {str(e)}',
-                'query': query
-            }
+            # 📄 ¿Hay más páginas?
+            page_token = search_response.get('nextPageToken')
+            if not page_token:
+                return
+            search_params['pageToken'] = page_token
 
     def search_channels(
         self,
         query: str,
         max_results: int = 5
-    ) -> Dict[str, Any]:
+    ) -> Union[SearchChannelsResponse, ErrorResponse]:
         """📺 Busca canales en YouTube con información detallada.
 
         Combina dos llamadas a la API:
-        1. search().list() - Para buscar canales por texto
+        1. search().list() - Para buscar canales por texto (solo IDs)
         2. channels().list() - Para obtener estadísticas y detalles completos
 
         Args:
@@ -240,88 +887,290 @@ class YouTubeService:
             >>> print(f"Canal: {canales['channels'][0]['title']}")
             >>> print(f"Suscriptores: {canales['channels'][0]['subscriber_count']}")
         """
+        # 🔍 Paso 1: Buscar canales por texto (solo IDs)
+        search_result = self.search_channel_ids(query, max_results=max_results)
+        if not search_result['success']:
+            return search_result
+
+        channel_ids = search_result['channel_ids']
+        if not channel_ids:
+            return {
+                'success': True,
+                'query': query,
+                'total_results': 0,
+                'channels': []
+            }
+
+        # 📊 Paso 2: Obtener información detallada de los canales
+        # (una sola llamada a channels.list con todos los IDs)
+        details = self.get_channels_details(channel_ids)
+        if not details['success']:
+            return details
+
+        return {
+            'success': True,
+            'query': query,
+            'total_results': details['total_results'],
+            'channels': details['channels']
+        }
+
+    def search_channel_ids(
+        self,
+        query: str,
+        max_results: int = 5
+    ) -> Union[ChannelIdsResponse, ErrorResponse]:
+        """🆔 Busca canales por texto y devuelve solo sus IDs (por relevancia).
+
+        Es el primer paso de :meth:`search_channels`. Por separado permite
+        pedir después los detalles y los últimos videos de esos canales a la vez.
+
+        Returns:
+            {'success': bool, 'query': str, 'channel_ids': [str, ...]}
+        """
         try:
-            # 🔍 Paso 1: Buscar canales por texto (obtiene IDs y snippet básico)
-            search_response = self.client.search().list(
+            # Solo necesitamos los IDs: el snippet ya lo trae channels.list
+            search_response = self._execute(self._api.search(
                 q=query,
-                part='id,snippet',
+                part=_SEARCH_IDS_PART,
+                fields=_SEARCH_CHANNEL_IDS_FIELDS,
                 maxResults=max_results,
                 type='channel'
-            ).execute()
-
-            # 📋 Extraer los IDs de los canales encontrados
-            channel_ids = [item['id']['channelId']
-                           for item in search_response.get('items', [])]
-
-            if not channel_ids:
-                return {
-                    'success': True,
-                    'query': query,
-                    'total_results': 0,
-                    'channels': []
-                }
+            ), _QUOTA_COST['search'])
 
-            # 📊 Paso 2: Obtener información detallada de los canales
-            channels_response = self.client.channels().list(
-                part='snippet,statistics,brandingSettings',
-                id=','.join(channel_ids)
-            ).execute()
+            return {
+                'success': True,
+                'query': query,
+                'channel_ids': [item['id']['channelId']
+                                for item in search_response.get('items', [])]
+            }
 
-            # 🎯 Procesar y combinar la información
-            channels = []
-            for item in channels_response.get('items', []):
-                channel_id = item['id']
-                snippet = item['snippet']
-                statistics = item.get('statistics', {})
-                branding = item.get('brandingSettings', {}).get('channel', {})
-
-                channel = {
-                    'channel_id': channel_id,
-                    'title': snippet['title'],
-                    'description': snippet['description'],
-                    'url': f'https://www.youtube.com/channel/{channel_id}',
-                    'thumbnail': snippet['thumbnails']['default']['url'],
-                    'published_at': snippet['publishedAt'],
-                    # 📊 Estadísticas detalladas
-                    'subscriber_count': int(statistics.get('subscriberCount', 0)),
-                    'video_count': int(statistics.get('videoCount', 0)),
-                    'view_count': int(statistics.get('viewCount', 0)),
-                    # 🎨 Branding info
-                    'country': branding.get('country', 'N/A')
-                }
-                channels.append(channel)
+        except _expected_errors() as e:
+            return _error(e)
+
+    def get_channels_details(
+        self,
+        channel_ids: List[str]
+    ) -> Union[ChannelsDetailsResponse, ErrorResponse]:
+        """📊 Obtiene estadísticas y detalles de varios canales a la vez.
+
+        ``channels().list`` acepta hasta 50 IDs separados por comas y cuesta
+        1 unidad de cuota por llamada, da igual cuántos IDs lleve. Por eso
+        agrupamos los IDs de 50 en 50 en lugar de hacer una llamada por canal.
+
+        La misma respuesta trae el ID de la playlist de "uploads" (``part``
+        contentDetails no cuesta más): se guarda para que luego
+        get_channel_latest_videos no tenga que pedirlo.
+
+        Args:
+            channel_ids: 🆔 Lista de IDs de canales de YouTube.
+
+        Returns:
+            dict con la forma:
+            {
+                'success': bool,
+                'total_results': int,
+                'channels': [...]  # Mismo formato que search_channels,
+                                   # en el mismo orden que channel_ids
+            }
+        """
+        try:
+            # 🧠 Primero miramos la caché; solo pedimos a la API los que faltan
+            channels_by_id: Dict[str, ChannelResult] = {}
+            missing_ids: List[str] = []
+            for channel_id in channel_ids:
+                cached = self._channel_cache.get(channel_id)
+                if cached is not None:
+                    channels_by_id[channel_id] = cached
+                else:
+                    missing_ids.append(channel_id)
+
+            uploads_ids: Dict[str, str] = {}
+            for start in range(0, len(missing_ids), _MAX_IDS_PER_REQUEST):
+                chunk = missing_ids[start:start + _MAX_IDS_PER_REQUEST]
+                channels_response = self._execute(self._api.channels(
+                    part=_CHANNELS_DETAILS_PART,
+                    fields=_CHANNELS_DETAILS_FIELDS,
+                    id=','.join(chunk)
+                ), _QUOTA_COST['channels'])
+
+                # 🎯 Procesar y combinar la información
+                for item in channels_response.get('items', []):
+                    channel_id = item['id']
+                    snippet = _get_snippet(item)
+                    title, description, published_at = _channel_details_fields(snippet)
+                    statistics = item.get('statistics', {})
+                    branding = item.get('brandingSettings', {}).get('channel', {})
+                    uploads = item.get('contentDetails', {}).get(
+                        'relatedPlaylists', {}).get('uploads')
+                    if uploads and channel_id not in self._uploads_playlist_ids:
+                        uploads_ids[channel_id] = uploads
+
+                    channels_by_id[channel_id] = {
+                        'channel_id': channel_id,
+                        'title': title,
+                        'description': description,
+                        'url': _CHANNEL_URL + channel_id,
+                        'thumbnail': _default_thumbnail(snippet),
+                        'published_at': published_at,
+                        # 📊 Estadísticas detalladas
+                        'subscriber_count': int(statistics.get('subscriberCount', 0)),
+                        'video_count': int(statistics.get('videoCount', 0)),
+                        'view_count': int(statistics.get('viewCount', 0)),
+                        # 🎨 Branding info
+                        'country': branding.get('country', 'N/A')
+                    }
+                    self._channel_cache.set(channel_id, channels_by_id[channel_id])
+
+            # 📋 Aprovechamos para guardar las playlists de uploads (memoria y disco)
+            if uploads_ids:
+                self._uploads_playlist_ids.update(uploads_ids)
+                _UPLOADS_DISK_CACHE.set_many(uploads_ids)
+
+            # 📋 Respetamos el orden de entrada (p.ej. el de relevancia de la búsqueda)
+            channels = [channels_by_id[channel_id]
+                        for channel_id in channel_ids if channel_id in channels_by_id]
 
             return {
                 'success': True,
-                'query': query,
                 'total_results': len(channels),
                 'channels': channels
             }
 
-        except HttpError as e:
+        except _expected_errors() as e:
+            return _error(e)
+
+    def get_videos_details(
+        self,
+        video_ids: List[str]
+    ) -> Union[VideosDetailsResponse, ErrorResponse]:
+        """🎞️ Obtiene detalles y estadísticas de varios videos a la vez.
+
+        Igual que con los canales, ``videos().list`` acepta hasta 50 IDs por
+        llamada (1 unidad de cuota), así que agrupamos en bloques de 50.
+
+        Args:
+            video_ids: 🆔 Lista de IDs de videos de YouTube.
+
+        Returns:
+            dict con la forma:
+            {
+                'success': bool,
+                'total_results': int,
+                'videos': {
+                    '<video_id>': {
+                        'video_id': str,
+                        'title': str,
+                        'description': str,
+                        'url': str,
+                        'thumbnail': str,
+                        'channel_id': str,
+                        'channel_title': str,
+                        'published_at': str,
+                        'duration': str,        # ⏱️ Duración ISO 8601 (ej: PT4M13S)
+                        'view_count': int,      # 👀 Visualizaciones
+                        'like_count': int,      # 👍 Me gusta
+                        'comment_count': int    # 💬 Comentarios
+                    }
+                }
+            }
+
+        Ejemplo:
+            >>> service = YouTubeService()
+            >>> details = service.get_videos_details(["dQw4w9WgXcQ", "9bZkp7q19f0"])
+            >>> print(details['videos']['dQw4w9WgXcQ']['view_count'])
+        """
+        try:
+            # 🧠 Primero miramos la caché; solo pedimos a la API los que faltan
+            videos: Dict[str, VideoDetailsResult] = {}
+            missing_ids: List[str] = []
+            for video_id in video_ids:
+                cached = self._video_cache.get(video_id)
+                if cached is not None:
+                    videos[video_id] = cached
+                else:
+                    missing_ids.append(video_id)
+
+            for start in range(0, len(missing_ids), _MAX_IDS_PER_REQUEST):
+                chunk = missing_ids[start:start + _MAX_IDS_PER_REQUEST]
+                videos_response = self._execute(self._api.videos(
+                    part=_VIDEOS_DETAILS_PART,
+                    fields=_VIDEOS_DETAILS_FIELDS,
+                    id=','.join(chunk)
+                ), _QUOTA_COST['videos'])
+
+                for item in videos_response.get('items', []):
+                    video_id = item['id']
+                    snippet = _get_snippet(item)
+                    (title, description, channel_id,
+                     channel_title, published_at) = _video_details_fields(snippet)
+                    statistics = item.get('statistics', {})
+                    videos[video_id] = {
+                        'video_id': video_id,
+                        'title': title,
+                        'description': description,
+                        'url': _WATCH_URL + video_id,
+                        'thumbnail': _default_thumbnail(snippet),
+                        'channel_id': channel_id,
+                        'channel_title': channel_title,
+                        'published_at': published_at,
+                        'duration': item.get('contentDetails', {}).get('duration', ''),
+                        'view_count': int(statistics.get('viewCount', 0)),
+                        'like_count': int(statistics.get('likeCount', 0)),
+                        'comment_count': int(statistics.get('commentCount', 0))
+                    }
+                    self._video_cache.set(video_id, videos[video_id])
+
             return {
-                'success': False,
-                'error': f'Error de API de YouTube: {e.resp.status} - {e.content.decode()}'
+                'success': True,
+                'total_results': len(videos),
+                'videos': videos
             }
-        except Exception as e:
+
+        except _expected_errors() as e:
+            return _error(e)
+
+    def get_video_details(self, video_id: str) -> Union[VideoDetailsResponse, ErrorResponse]:
+        """🎞️ Obtiene los detalles de un único video.
+
+        Es un atajo sobre :meth:`get_videos_details`; si necesitas varios
+        videos, usa ese método directamente para hacer una sola llamada.
+
+        Returns:
+            {'success': True, 'video': {...}} o {'success': False, 'error': str}
+        """
+        details = self.get_videos_details([video_id])
+        if not details['success']:
+            return details
+
+        video = details['videos'].get(video_id)
+        if video is None:
             return {
                 'success': False,
-                'error': f'Error inesperado: {str(e)}'
+                'error': f'Video no encontrado: {video_id}'
             }
+        return {'success': True, 'video': video}
 
     def get_channel_latest_videos(
         self,
         channel_id: str,
-        max_results: int = 5
-    ) -> Dict[str, Any]:
+        max_results: int = 5,
+        fast: bool = False
+    ) -> Union[ChannelVideosResponse, ErrorResponse]:
         """📹 Obtiene los últimos videos publicados de un canal concreto.
 
-        Usa la operación ``search().list`` filtrando por ``channelId`` y
-        ordenando por fecha descendente para traer los videos más recientes.
+        Hay dos formas de obtenerlos:
+
+        - ``fast=False`` (por defecto): lee la playlist de "uploads" del canal
+          con ``playlistItems().list``. Cuesta 1 unidad de cuota (+1 la primera
+          vez, para averiguar el ID de esa playlist, que luego se guarda).
+        - ``fast=True``: una sola llamada a ``search().list`` filtrando por
+          ``channelId`` y ordenando por fecha. Ahorra un viaje de ida y vuelta
+          cuando el ID de la playlist no está en caché, pero cuesta 100 unidades.
 
         Args:
             channel_id: 🆔 ID del canal de YouTube.
             max_results: 🔢 Número máximo de videos a retornar (1-50).
+            fast: ⚡ Usar ``search().list`` (1 llamada, 100 unidades de cuota).
 
         Returns:
             dict con la forma:
@@ -340,43 +1189,456 @@ class YouTubeService:
                     }
                 ]
             }
+
+        💡 Para varios canales, usa :meth:`get_channels_latest_videos`,
+        que los agrupa en una única petición HTTP.
         """
-        try:
-            search_response = self.client.search().list(
-                channelId=channel_id,
-                part='id,snippet',
-                maxResults=min(max_results, 50),
-                order='date',  # 🗓️ Lo más reciente primero
-                type='video'
-            ).execute()
-
-            videos: List[Dict[str, Any]] = []
-            for item in search_response.get('items', []):
-                video_id = item['id']['videoId']
-                snippet = item['snippet']
-                videos.append({
-                    'video_id': video_id,
-                    'title': snippet['title'],
-                    'description': snippet['description'],
-                    'url': f'https://www.youtube.com/watch?v={video_id}',
-                    'thumbnail': snippet['thumbnails']['default']['url'],
-                    'published_at': snippet['publishedAt']
-                })
+        # 🧠 ¿Lo hemos pedido hace poco?
+        cache_key = _latest_videos_key(channel_id, max_results, fast)
+        cached = self._latest_videos_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            return {
+        try:
+            videos = list(self.iter_channel_videos(
+                channel_id, max_results=min(max_results, 50), fast=fast))
+            result: ChannelVideosResponse = {
                 'success': True,
                 'channel_id': channel_id,
                 'total_results': len(videos),
                 'videos': videos
             }
+            self._latest_videos_cache.set(cache_key, result)
+            return result
 
-        except HttpError as e:
-            return {
-                'success': False,
-                'error': f'Error de API de YouTube: {e.resp.status} - {e.content.decode()}'
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Error inesperado: {str(e)}'
+        except _expected_errors() as e:
+            return _error(e)
+
+    def get_channels_latest_videos(
+        self,
+        channel_ids: List[str],
+        max_results: int = 5,
+        fast: bool = False
+    ) -> List[Union[ChannelVideosResponse, ErrorResponse]]:
+        """📹 Obtiene los últimos videos de varios canales en una sola petición HTTP.
+
+        Usa :meth:`batch` para enviar todas las peticiones juntas en lugar de
+        hacer una por canal. Con ``fast=False`` los IDs de las playlists de
+        uploads que falten se resuelven antes con una única llamada a
+        ``channels().list``.
+
+        Args:
+            channel_ids: 🆔 Lista de IDs de canales de YouTube.
+            max_results: 🔢 Número máximo de videos por canal (1-50).
+            fast: ⚡ Igual que en :meth:`get_channel_latest_videos`.
+
+        Returns:
+            Lista con un resultado por canal (mismo formato que
+            :meth:`get_channel_latest_videos`), en el mismo orden que ``channel_ids``.
+        """
+        # 📋 Resultado de cada canal, por su posición en channel_ids
+        results: Dict[int, Union[ChannelVideosResponse, ErrorResponse]] = {}
+
+        # 🧠 Los canales que ya están en caché no entran en el batch
+        pending: List[int] = []
+        for index, channel_id in enumerate(channel_ids):
+            cached = self._latest_videos_cache.get(
+                _latest_videos_key(channel_id, max_results, fast))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        if not pending:
+            return [results[index] for index in range(len(channel_ids))]
+
+        def on_response(index: int, channel_id: str):
+            # 🎯 Cada sub-petición del batch llama a su propio callback
+            def callback(response, exception):
+                if exception is None:
+                    results[index] = self._parse_channel_latest_videos(
+                        channel_id, response, fast)
+                    self._latest_videos_cache.set(
+                        _latest_videos_key(channel_id, max_results, fast), results[index])
+                else:
+                    results[index] = _error(exception)
+            return callback
+
+        try:
+            if not fast:
+                # 📋 Una sola llamada para los IDs de playlist que no tenemos
+                uploads = self._get_uploads_playlist_ids(
+                    [channel_ids[index] for index in pending])
+
+            with self.batch() as batch:
+                for index in pending:
+                    channel_id = channel_ids[index]
+                    if not fast and channel_id not in uploads:
+                        results[index] = _error(ChannelNotFoundError(channel_id))
+                        continue
+                    batch.add(
+                        self._channel_videos_request(channel_id, max_results, fast=fast),
+                        on_response(index, channel_id),
+                        cost=_QUOTA_COST['search'] if fast else _QUOTA_COST['playlist_items']
+                    )
+        except _expected_errors() as e:
+            # ❌ Falló el batch (o no quedaba cuota para alguna sub-petición):
+            # los canales pendientes que no tienen resultado comparten el error
+            error = _error(e)
+            for index in pending:
+                results.setdefault(index, error)
+
+        return [results[index] for index in range(len(channel_ids))]
+
+    def iter_channel_videos(
+        self,
+        channel_id: str,
+        max_results: int = 5,
+        fast: bool = False
+    ) -> Iterator[VideoResult]:
+        """🔁 Genera los videos de un canal (del más reciente al más antiguo) uno a uno.
+
+        Como :meth:`iter_search_videos`: pagina con ``nextPageToken`` si
+        ``max_results`` es mayor que 50 y deja de pedir páginas en cuanto
+        el consumidor hace ``break``. ``fast`` funciona igual que en
+        :meth:`get_channel_latest_videos`.
+
+        Raises:
+            HttpError: ❌ Si hay un error en la llamada a la API de YouTube
+            ChannelNotFoundError: 🔎 Si el canal no existe (solo con ``fast=False``)
+        """
+        remaining = max_results
+        page_token = None
+        parse = self._parse_search_video if fast else self._parse_playlist_video
+        cost = _QUOTA_COST['search'] if fast else _QUOTA_COST['playlist_items']
+        while remaining > 0:
+            response = self._execute(self._channel_videos_request(
+                channel_id, remaining, page_token, fast=fast), cost)
+
+            for item in response.get('items', []):
+                yield parse(item)
+                remaining -= 1
+                if remaining == 0:
+                    return
+
+            # 📄 ¿Hay más páginas?
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+
+    def _get_uploads_playlist_ids(self, channel_ids: List[str]) -> Dict[str, str]:
+        """📋 Devuelve el ID de la playlist de "uploads" de cada canal.
+
+        Ese ID no cambia nunca, así que se guarda para siempre en memoria y en
+        disco (``_UPLOADS_DISK_CACHE``) y solo se pide a la API (en bloques de
+        50, con la mínima ``part``) la primera vez que se ve un canal.
+
+        Returns:
+            dict ``channel_id -> uploads_playlist_id`` (los canales que no
+            existen no aparecen).
+        """
+        missing_ids = [channel_id for channel_id in channel_ids
+                       if channel_id not in self._uploads_playlist_ids]
+
+        # 💽 ¿Los tenemos de una ejecución anterior?
+        if missing_ids:
+            from_disk = _UPLOADS_DISK_CACHE.get_many(missing_ids)
+            self._uploads_playlist_ids.update(from_disk)
+            missing_ids = [channel_id for channel_id in missing_ids
+                           if channel_id not in from_disk]
+
+        fetched: Dict[str, str] = {}
+        for start in range(0, len(missing_ids), _MAX_IDS_PER_REQUEST):
+            chunk = missing_ids[start:start + _MAX_IDS_PER_REQUEST]
+            channels_response = self._execute(self._api.channels(
+                part=_UPLOADS_PLAYLIST_PART,
+                fields=_UPLOADS_PLAYLIST_FIELDS,
+                id=','.join(chunk)
+            ), _QUOTA_COST['channels'])
+            for item in channels_response.get('items', []):
+                uploads = item.get('contentDetails', {}).get(
+                    'relatedPlaylists', {}).get('uploads')
+                if uploads:
+                    fetched[item['id']] = uploads
+
+        if fetched:
+            self._uploads_playlist_ids.update(fetched)
+            _UPLOADS_DISK_CACHE.set_many(fetched)
+
+        return {channel_id: self._uploads_playlist_ids[channel_id]
+                for channel_id in channel_ids
+                if channel_id in self._uploads_playlist_ids}
+
+    def _channel_videos_request(
+        self,
+        channel_id: str,
+        max_results: int,
+        page_token: Optional[str] = None,
+        fast: bool = False
+    ):
+        """🧱 Construye (sin ejecutar) la petición de últimos videos de un canal."""
+        if fast:
+            params = {
+                'channelId': channel_id,
+                'part': _SEARCH_PART,
+                'fields': _CHANNEL_LATEST_VIDEOS_FIELDS,
+                'maxResults': min(max_results, 50),
+                'order': 'date',  # 🗓️ Lo más reciente primero
+                'type': 'video'
             }
+            if page_token:
+                params['pageToken'] = page_token
+            return self._api.search(**params)
+
+        uploads = self._get_uploads_playlist_ids([channel_id]).get(channel_id)
+        if uploads is None:
+            raise ChannelNotFoundError(channel_id)
+
+        # 📼 La playlist de uploads ya viene ordenada de más reciente a más antiguo
+        params = {
+            'playlistId': uploads,
+            'part': _PLAYLIST_ITEMS_PART,
+            'fields': _PLAYLIST_ITEMS_FIELDS,
+            'maxResults': min(max_results, 50)
+        }
+        if page_token:
+            params['pageToken'] = page_token
+        return self._api.playlist_items(**params)
+
+    @staticmethod
+    def _parse_search_video(item: Dict[str, Any]) -> VideoResult:
+        """📝 Convierte un resultado de search.list en un VideoResult."""
+        video_id = _get_video_id(item['id'])
+        snippet = _get_snippet(item)
+        title, description, published_at = _channel_video_fields(snippet)
+        return {
+            'video_id': video_id,
+            'title': title,
+            'description': description,
+            'url': _WATCH_URL + video_id,
+            'thumbnail': _default_thumbnail(snippet),
+            'published_at': published_at
+        }
+
+    @staticmethod
+    def _parse_playlist_video(item: Dict[str, Any]) -> VideoResult:
+        """📝 Convierte un elemento de playlistItems.list en un VideoResult."""
+        snippet = _get_snippet(item)
+        video_id = _get_video_id(snippet['resourceId'])
+        # 📅 Fecha de publicación del video (no la de alta en la playlist);
+        # los videos privados no la tienen: usamos la de alta en la playlist
+        # (en la de uploads coincide con la subida del video)
+        try:
+            published_at = item['contentDetails']['videoPublishedAt']
+        except KeyError:
+            published_at = snippet.get('publishedAt', '')
+        return {
+            'video_id': video_id,
+            'title': snippet['title'],
+            'description': snippet['description'],
+            'url': _WATCH_URL + video_id,
+            # 🔒 Los videos privados tampoco tienen miniatura
+            'thumbnail': _default_thumbnail(snippet),
+            'published_at': published_at
+        }
+
+    @classmethod
+    def _parse_channel_latest_videos(
+        cls,
+        channel_id: str,
+        response: Dict[str, Any],
+        fast: bool = False
+    ) -> ChannelVideosResponse:
+        """📝 Convierte la respuesta de la API al formato de get_channel_latest_videos."""
+        parse = cls._parse_search_video if fast else cls._parse_playlist_video
+        videos: List[VideoResult] = [
+            parse(item) for item in response.get('items', [])
+        ]
+
+        return {
+            'success': True,
+            'channel_id': channel_id,
+            'total_results': len(videos),
+            'videos': videos
+        }
+
+    @contextmanager
+    def batch(self) -> Iterator['YouTubeBatch']:
+        """📦 Agrupa varias peticiones a la API en una sola petición HTTP.
+
+        Todas las peticiones añadidas dentro del bloque ``with`` se envían
+        juntas al salir de él (o cada 50, si se añaden más). También si el
+        bloque lanza una excepción: su cuota ya está descontada.
+
+        Ejemplo:
+            >>> with service.batch() as batch:
+            ...     batch.add(service.client.videos().list(part='snippet', id='a'), callback)
+            ...     batch.add(service.client.channels().list(part='snippet', id='b'), callback)
+            >>> # Aquí ya se han ejecutado y se han llamado los callbacks
+        """
+        batch = YouTubeBatch(self.client, quota=self._quota)
+        try:
+            yield batch
+        finally:
+            batch.execute()
+
+
+@lru_cache(maxsize=4)
+def get_service(api_key: Optional[str] = None) -> YouTubeService:
+    """♻️ Devuelve un YouTubeService compartido para ``api_key``.
+
+    Todas las tools (y cualquier handler que se cree por petición) reciben la
+    misma instancia por key, así comparten cliente, cachés y cuota en lugar
+    de crear un servicio nuevo cada vez.
+
+    Args:
+        api_key: 🔑 API key de YouTube. Si es None, se lee de las variables
+                 de entorno (ver ``YouTubeConfig.from_env``).
+
+    Raises:
+        ValueError: ❌ Si no se pasa api_key y YOUTUBE_API_KEY no está configurada
+    """
+    if api_key is None:
+        return YouTubeService()
+    return YouTubeService(YouTubeConfig(api_key=api_key))
+
+
+class AsyncYouTubeService:
+    """⚡ Versión async de YouTubeService para usar desde tools async.
+
+    googleapiclient es síncrono: cada llamada bloquea hasta recibir la respuesta.
+    Esta clase ejecuta cada método de YouTubeService en un hilo aparte con
+    ``asyncio.to_thread()``, así el event loop de FastMCP sigue atendiendo
+    otras peticiones mientras esperamos a YouTube.
+
+    Los métodos ``batch_*`` lanzan varias llamadas independientes a la vez con
+    ``asyncio.gather()``, limitando cuántas hay en vuelo simultáneamente.
+
+    Ejemplo:
+        >>> service = AsyncYouTubeService()
+        >>> results = await service.search_videos("Python", max_results=3)
+        >>> videos = await service.batch_get_channel_latest_videos(["UC1", "UC2"])
+    """
+
+    def __init__(
+        self,
+        service: Optional[YouTubeService] = None,
+        max_concurrency: int = 5
+    ):
+        """🚀 Inicializa el servicio async.
+
+        Args:
+            service: Servicio síncrono a envolver. Si es None, se usa el
+                     compartido de :func:`get_service` (configurado desde
+                     las variables de entorno).
+            max_concurrency: 🚦 Máximo de llamadas simultáneas a la API
+                             en los métodos ``batch_*`` (default: 5).
+        """
+        self.service = service or get_service()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """🧵 Ejecuta un método síncrono en un hilo respetando el límite de concurrencia."""
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def search_videos(self, *args, **kwargs) -> Union[SearchVideosResponse, ErrorResponse]:
+        """🔍 Versión async de :meth:`YouTubeService.search_videos`."""
+        return await self._run(self.service.search_videos, *args, **kwargs)
+
+    async def search_channels(self, *args, **kwargs) -> Union[SearchChannelsResponse, ErrorResponse]:
+        """📺 Versión async de :meth:`YouTubeService.search_channels`."""
+        return await self._run(self.service.search_channels, *args, **kwargs)
+
+    async def search_channel_ids(self, *args, **kwargs) -> Union[ChannelIdsResponse, ErrorResponse]:
+        """🆔 Versión async de :meth:`YouTubeService.search_channel_ids`."""
+        return await self._run(self.service.search_channel_ids, *args, **kwargs)
+
+    async def get_channels_details(self, *args, **kwargs) -> Union[ChannelsDetailsResponse, ErrorResponse]:
+        """📊 Versión async de :meth:`YouTubeService.get_channels_details`."""
+        return await self._run(self.service.get_channels_details, *args, **kwargs)
+
+    async def get_videos_details(self, *args, **kwargs) -> Union[VideosDetailsResponse, ErrorResponse]:
+        """🎞️ Versión async de :meth:`YouTubeService.get_videos_details`."""
+        return await self._run(self.service.get_videos_details, *args, **kwargs)
+
+    async def get_video_details(self, *args, **kwargs) -> Union[VideoDetailsResponse, ErrorResponse]:
+        """🎞️ Versión async de :meth:`YouTubeService.get_video_details`."""
+        return await self._run(self.service.get_video_details, *args, **kwargs)
+
+    async def get_channel_latest_videos(self, *args, **kwargs) -> Union[ChannelVideosResponse, ErrorResponse]:
+        """📹 Versión async de :meth:`YouTubeService.get_channel_latest_videos`."""
+        return await self._run(self.service.get_channel_latest_videos, *args, **kwargs)
+
+    async def get_channels_latest_videos(self, *args, **kwargs) -> List[Union[ChannelVideosResponse, ErrorResponse]]:
+        """📹 Versión async de :meth:`YouTubeService.get_channels_latest_videos`."""
+        return await self._run(self.service.get_channels_latest_videos, *args, **kwargs)
+
+    async def batch_search_videos(
+        self,
+        queries: List[str],
+        **kwargs: Any
+    ) -> List[Union[SearchVideosResponse, ErrorResponse]]:
+        """🔍 Lanza varias búsquedas de videos en paralelo.
+
+        Args:
+            queries: Lista de términos de búsqueda.
+            **kwargs: Resto de parámetros de :meth:`YouTubeService.search_videos`.
+
+        Returns:
+            Lista de resultados, en el mismo orden que ``queries``.
+        """
+        return await asyncio.gather(*(
+            self.search_videos(query, **kwargs) for query in queries
+        ))
+
+    async def batch_get_channel_latest_videos(
+        self,
+        channel_ids: List[str],
+        max_results: int = 5
+    ) -> List[Union[ChannelVideosResponse, ErrorResponse]]:
+        """📹 Obtiene en paralelo los últimos videos de varios canales.
+
+        Args:
+            channel_ids: Lista de IDs de canales de YouTube.
+            max_results: Número máximo de videos por canal.
+
+        Returns:
+            Lista de resultados, en el mismo orden que ``channel_ids``.
+        """
+        return await asyncio.gather(*(
+            self.get_channel_latest_videos(channel_id=channel_id, max_results=max_results)
+            for channel_id in channel_ids
+        ))
+
+
+@lru_cache(maxsize=None)
+def _shared_async_service() -> AsyncYouTubeService:
+    """♻️ AsyncYouTubeService único por proceso.
+
+    lru_cache no guarda las excepciones: si falta la API key (ValueError),
+    se vuelve a intentar en la siguiente llamada.
+    """
+    # 🚦 AsyncYouTubeService limita a 5 las llamadas simultáneas a la API
+    # para evitar ráfagas que agoten la cuota por usuario de golpe
+    return AsyncYouTubeService(max_concurrency=5)
+
+
+def get_youtube_service() -> Optional[AsyncYouTubeService]:
+    """🔌 Servicio async compartido por todas las tools (None si falta la API key).
+
+    Se crea la primera vez que se llama con la API key configurada: todas las
+    tools comparten instancia (y con ella el límite de concurrencia, las
+    cachés y la cuota). Si la key aún no está, no se memoiza nada, así que
+    configurarla después surte efecto sin reiniciar el servidor.
+
+    Returns:
+        AsyncYouTubeService, o None si YOUTUBE_API_KEY no está configurada
+        (cada tool devuelve entonces un error descriptivo).
+    """
+    try:
+        return _shared_async_service()
+    except ValueError as e:
+        # ⚠️ Si no hay API key, el servicio será None y lo manejaremos en cada tool
+        logger.warning("Advertencia: %s", e)
+        return None
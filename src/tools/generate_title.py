@@ -1,6 +1,7 @@
 # 📦 Importaciones necesarias
 from fastmcp import Context, FastMCP  # Framework MCP
 from utils.icons import load_icon  # Utilidad para cargar iconos
+from utils.cache import TTLCache, canon_topic  # Caché en memoria con caducidad
 
 # 🤖 Creamos una instancia de FastMCP para esta herramienta específica
 # Esta herramienta demuestra el concepto de "sampling" (usar IA del cliente)
@@ -10,6 +11,32 @@ sampling_mcp_demo = FastMCP("Tools and prompt for generating cool titles")
 # 🎨 Cargamos el icono de la tool
 tool_icons = load_icon("youtube-title.png")
 
+# 📝 Plantilla del prompt que enviamos al modelo (se rellena con el tema)
+TITLE_PROMPT = (
+    "Generate a catchy YouTube video title based on the topic: {topic}. "
+    "Before generating the title, search for popular titles on YouTube related to the topic."
+)
+
+# 🎯 Preferencia de modelos (el cliente elegirá el primero disponible)
+MODEL_PREFERENCES = ["claude-opus-4-5", "claude-sonnet-4-5"]
+# 🌡️ Temperature: 0.7 = balance entre creatividad y coherencia
+# (0.0 = muy predecible, 1.0 = muy creativo/aleatorio)
+TEMPERATURE = 0.7
+
+# 🧠 Caché de títulos generados: (sesión, tema normalizado, modelos, temperature) -> título
+# Cada título cuesta una llamada al modelo del cliente; si se repite el mismo
+# tema (reintentos, flujos repetidos) devolvemos el que ya generamos
+_title_cache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def _title_cache_key(session_id: str, topic: str) -> tuple:
+    """🔑 Clave de caché: la sesión MCP y el tema sin mayúsculas ni espacios de más.
+
+    El título lo genera el modelo de cada cliente, así que solo se reutiliza
+    dentro de la misma sesión (con HTTP hay varios clientes a la vez).
+    """
+    return (session_id, canon_topic(topic), tuple(MODEL_PREFERENCES), round(TEMPERATURE, 2))
+
 
 @sampling_mcp_demo.tool(icons=tool_icons)
 async def generate_youtube_title(ctx: Context, topic: str) -> str:
@@ -38,16 +65,26 @@ async def generate_youtube_title(ctx: Context, topic: str) -> str:
         >>> print(title)
         "🐍 Python para PRINCIPIANTES: ¡Aprende en 30 Minutos! 🚀"
     """
+    # 🧠 ¿Ya generamos un título para este tema en esta sesión?
+    cache_key = _title_cache_key(ctx.session_id, topic)
+    cached = _title_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # 🤖 Aquí es donde ocurre la "magia" del sampling
     # Le pedimos al CLIENTE que use su modelo de IA para generar el título
     result = await ctx.sample(
         # 📝 El prompt que enviamos al modelo
-        messages=f"Generate a catchy YouTube video title based on the topic: {topic}. Before generating the title, search for popular titles on YouTube related to the topic.",
+        messages=TITLE_PROMPT.format(topic=topic),
         # 🎯 Preferencia de modelos (el cliente elegirá el primero disponible)
-        model_preferences=["claude-opus-4-5", "claude-sonnet-4-5"],
-        # 🌡️ Temperature: 0.7 = balance entre creatividad y coherencia
-        # (0.0 = muy predecible, 1.0 = muy creativo/aleatorio)
-        temperature=0.7
+        model_preferences=MODEL_PREFERENCES,
+        # 🌡️ Temperature: ver TEMPERATURE
+        temperature=TEMPERATURE
     )
     # ✅ Retornamos el texto generado (o string vacío si falla)
-    return result.text or ""
+    title = result.text or ""
+
+    # 💾 Solo guardamos en caché los títulos que no están vacíos
+    if title:
+        _title_cache.set(cache_key, title)
+    return title
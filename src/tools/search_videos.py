@@ -1,23 +1,17 @@
 # 📦 Importaciones
-from pydantic import Field  # Para validación de campos en prompts
-from services import YouTubeService  # Nuestro servicio de YouTube
-import os  # Para leer variables de entorno
+from pydantic import Field  # Para validación de campos en tools y prompts
+from typing import Annotated
 from fastmcp import Context, FastMCP  # Framework MCP
 from utils.icons import load_icon  # Utilidad para cargar iconos
+from utils.cache import TTLCache, canon_topic  # Caché en memoria con caducidad
 
+# 🧠 Caché de resultados de búsqueda: (topic, max_results) -> resultado
+# Las búsquedas se repiten mucho y cada una cuesta 100 unidades de cuota,
+# así que guardamos los resultados durante 10 minutos
+_search_cache = TTLCache(maxsize=1024, ttl=600)
 
-# 🔑 Configuración de la API de YouTube
-# Leemos la API key desde las variables de entorno
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-
-# 🚀 Inicializar el servicio de YouTube
-# Usamos try/except para manejar el caso de que no esté configurada la API key
-try:
-    youtube_service = YouTubeService()
-except ValueError as e:
-    # ⚠️ Si no hay API key, el servicio será None y lo manejaremos en cada tool
-    youtube_service = None
-    print(f"Advertencia: {e}")
+# 📝 Plantilla del prompt de búsqueda (en español)
+SEARCH_PROMPT = "Busca máximo {max_results} vídeos relacionados con {topic} en {language}"
 
 # 🔍 Creamos una instancia de FastMCP para la búsqueda de videos
 # Esta herramienta agrupa todo lo relacionado con buscar videos
@@ -34,18 +28,27 @@ tool_icons = load_icon("youtube-videos.png")
 @search_mcp.tool(
     icons=tool_icons,
 )
-def search_videos(topic: str, max_results: int = 5) -> dict:
+async def search_videos(
+    topic: str,
+    # 🛡️ FastMCP valida el rango antes de llamar a la tool: un valor fuera
+    # de 1-50 se rechaza sin gastar una llamada (ni cuota) a la API
+    max_results: Annotated[int, Field(ge=1, le=50)] = 5
+) -> dict:
     """🔍 Busca videos relacionados con un tema en YouTube.
 
     Esta es una herramienta simple que encapsula la funcionalidad de búsqueda.
     El decorador @search_mcp.tool hace que esta función esté disponible
     como una "tool" que los clientes MCP pueden invocar.
 
+    ⚡ Es async: AsyncYouTubeService ejecuta la llamada a la API (bloqueante)
+    en un hilo aparte, así el servidor puede atender otras tools mientras
+    espera la respuesta de YouTube.
+
     Args:
         topic (str): 🎯 El tema o título del video a buscar
                      (ej: "Tutorial de Python", "Recetas veganas")
         max_results (int): 🔢 Número máximo de resultados a retornar (default: 5)
-                           Rango válido: 1-50
+                           Rango válido: 1-50 (validado en el esquema de la tool)
 
     Returns:
         dict: 📦 Diccionario con la información de los videos:
@@ -65,29 +68,49 @@ def search_videos(topic: str, max_results: int = 5) -> dict:
         }
 
     Ejemplo de uso:
-        >>> results = search_videos("Python tutorial", max_results=3)
+        >>> results = await search_videos("Python tutorial", max_results=3)
         >>> for video in results['videos']:
         ...     print(f"{video['title']} - {video['url']}")
     """
+    # 🐢 Importamos el servicio aquí, no al cargar el módulo: se crea (y se lee
+    # el .env) la primera vez que se usa una tool, y todas lo comparten
+    from services import get_youtube_service
+
     # 🔒 Verificamos que el servicio de YouTube esté disponible
     # Si no hay API key configurada, retornamos un error descriptivo
+    youtube_service = get_youtube_service()
     if not youtube_service:
         return {
             "error": "YOUTUBE_API_KEY not set. Please set the environment variable.",
             "instructions": "Get your API key from https://console.cloud.google.com/apis/credentials"
         }
 
+    # 🧠 Si ya hicimos esta búsqueda hace poco, devolvemos el resultado guardado
+    # 🔤 La clave usa el tema normalizado: "Python  Tutorial" y "python tutorial"
+    # son la misma búsqueda (la de YouTube no distingue mayúsculas). A la API
+    # y en el resultado va el tema tal y como lo escribió el usuario
+    cache_key = (canon_topic(topic), max_results)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        # 📋 Copia con el 'query' de esta llamada (el guardado puede estar escrito distinto)
+        return {**cached, 'query': topic}
+
     # 🚀 Delegamos la búsqueda al servicio de YouTube
     # Esto mantiene la lógica de negocio separada de la tool
-    return youtube_service.search_videos(
+    result = await youtube_service.search_videos(
         query=topic,
         max_results=max_results,
         order='relevance'  # 📊 Ordenamos por relevancia
     )
 
+    # 💾 Solo guardamos en caché las búsquedas exitosas
+    if result['success']:
+        _search_cache.set(cache_key, result)
+    return result
+
 
 @search_mcp.prompt()
-def search_prompt(ctx: Context, topic: str, language: str = Field(examples=["English", "Spanish", "French"]), max_results: int = 5) -> str:
+async def search_prompt(ctx: Context, topic: str, language: str = Field(examples=["English", "Spanish", "French"]), max_results: int = 5) -> str:
     """📝 Genera un prompt para buscar videos de YouTube.
 
     💡 ¿Qué son los "prompts" en MCP?
@@ -110,8 +133,9 @@ def search_prompt(ctx: Context, topic: str, language: str = Field(examples=["Eng
     """
 
     # 🐛 Registramos información de debug para troubleshooting
-    ctx.debug(
+    # ctx.debug() es async: sin await el mensaje nunca llega a enviarse
+    await ctx.debug(
         f"Generating search prompt for topic: {topic}, language: {language}, max_results: {max_results}")
 
     # ✨ Retornamos el prompt formateado en español
-    return f"Busca máximo {max_results} vídeos relacionados con {topic} en {language}"
+    return SEARCH_PROMPT.format(max_results=max_results, topic=topic, language=language)
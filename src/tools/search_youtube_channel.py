@@ -1,13 +1,11 @@
 # 📦 Importaciones
-import os
+import asyncio  # Para pedir detalles y videos a la vez
 from fastmcp import FastMCP, Context  # Framework MCP
 from enum import Enum  # Para crear opciones con emojis
 
 from dataclasses import dataclass  # Para crear clases de datos simples
-from services import YouTubeService  # Nuestro servicio de YouTube
 from utils.icons import load_icon  # Utilidad para cargar iconos
 
-
 # 🎬 Enum para las opciones de inclusión de videos con emojis
 class IncludeVideosOption(str, Enum):
     """Opciones para incluir los últimos videos del canal"""
@@ -27,17 +25,6 @@ class YouTubeChannelInfo:
     include_latest_videos: IncludeVideosOption = IncludeVideosOption.SI  # ¿Incluir los últimos videos? 📹
 
 
-# 🔑 Configuración de la API de YouTube
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-
-# 🚀 Inicializar el servicio de YouTube
-try:
-    youtube_service = YouTubeService()
-except ValueError as e:
-    youtube_service = None
-    print(f"Advertencia: {e}")
-
-
 # 💬 Creamos una instancia de FastMCP para demostrar "elicitation"
 # Elicitation = pedir información adicional al usuario de forma interactiva
 elicitation_mcp_demo = FastMCP(
@@ -58,10 +45,11 @@ async def search_youtube_channel(ctx: Context, channel_name: str) -> dict:
 
     🔄 Flujo de esta tool:
     1. Usuario invoca la tool con el nombre del canal 📥
-    2. La tool usa elicitation para preguntar: "¿Quieres los últimos videos?" 💬
-    3. Usuario responde (accept/decline/cancel) 👤
-    4. Basándose en la respuesta, obtenemos info básica o completa 📊
-    5. Retornamos los resultados 📤
+    2. Buscamos los canales (si no hay ninguno, terminamos sin preguntar) 🔍
+    3. La tool usa elicitation para preguntar: "¿Quieres los últimos videos?" 💬
+    4. Usuario responde (accept/decline/cancel) 👤
+    5. Basándose en la respuesta, obtenemos info básica o completa 📊
+    6. Retornamos los resultados 📤
 
     Esto es útil para:
     - Evitar parámetros complicados en la firma de la función 🎯
@@ -94,27 +82,10 @@ async def search_youtube_channel(ctx: Context, channel_name: str) -> dict:
         >>> canal = await search_youtube_channel(ctx, "Python en español")
         >>> print(f"{canal['title']} tiene {canal['subscriber_count']} subs")
     """
-    # 💬 Aquí ocurre la "elicitation" - pedimos info adicional al usuario
-    # Le preguntamos si quiere incluir los últimos videos del canal
-    result = await ctx.elicit(
-        message="¿Puedes contestar a las siguientes preguntas?",
-        response_type=YouTubeChannelInfo  # 📋 Tipo de dato que esperamos recibir
-    )
-
-    # 🔀 Manejamos las diferentes respuestas del usuario
-    if result.action == "accept":
-        # ✅ Usuario aceptó y proporcionó la información
-        channel = result.data
-        # 🎥 Verificamos si el usuario quiso incluir los últimos videos
-        include_videos = channel.include_latest_videos == IncludeVideosOption.SI
-    elif result.action == "decline":
-        # ❌ Usuario rechazó proporcionar la información
-        return "Information not provided"
-    else:  # cancel
-        # 🚫 Usuario canceló la operación
-        return "Operation cancelled"
+    from services import get_youtube_service  # 🐢 Import perezoso (ver search_videos)
 
     # 🔒 Verificamos que el servicio de YouTube esté disponible
+    youtube_service = get_youtube_service()
     if not youtube_service:
         return {
             "error": "YOUTUBE_API_KEY not set. Please set the environment variable.",
@@ -123,51 +94,91 @@ async def search_youtube_channel(ctx: Context, channel_name: str) -> dict:
 
     # 🔍 Buscar canales por nombre
     # Obtenemos hasta 5 resultados para dar más opciones
-    search_result = youtube_service.search_channels(
+    search_result = await youtube_service.search_channel_ids(
         query=channel_name, max_results=5)
 
     # ❌ Verificamos que encontramos canales
-    if not search_result.get('success'):
+    if not search_result['success']:
         return {"error": f"Search failed: {search_result.get('error')}"}
 
-    if not search_result.get('channels'):
+    # ⚡ Si no hay canales, terminamos aquí sin molestar al usuario con preguntas
+    channel_ids = search_result['channel_ids']
+    if not channel_ids:
         return {"error": "No channels found matching that name"}
 
+    # ⚡ Mientras el usuario contesta, vamos pidiendo los detalles de los canales
+    # (los de todos los canales van en una sola llamada a channels.list)
+    details_task = asyncio.ensure_future(
+        youtube_service.get_channels_details(channel_ids))
+
+    try:
+        # 💬 Aquí ocurre la "elicitation" - pedimos info adicional al usuario
+        # Le preguntamos si quiere incluir los últimos videos del canal
+        result = await ctx.elicit(
+            message="¿Puedes contestar a las siguientes preguntas?",
+            response_type=YouTubeChannelInfo  # 📋 Tipo de dato que esperamos recibir
+        )
+
+        # 🔀 Manejamos las diferentes respuestas del usuario
+        match result.action:
+            case "accept":
+                # ✅ Usuario aceptó y proporcionó la información
+                channel = result.data
+                # 🎥 Verificamos si el usuario quiso incluir los últimos videos
+                include_videos = channel.include_latest_videos == IncludeVideosOption.SI
+            case "decline":
+                # ❌ Usuario rechazó proporcionar la información
+                details_task.cancel()
+                return "Information not provided"
+            case _:  # cancel
+                # 🚫 Usuario canceló la operación
+                details_task.cancel()
+                return "Operation cancelled"
+    except BaseException:
+        # 🧹 Si la elicitation falla (p.ej. el cliente no la soporta) o la tool
+        # se cancela, no dejamos la petición de detalles huérfana
+        details_task.cancel()
+        raise
+
+    # 🎬 Con los IDs, los últimos videos no dependen de los detalles:
+    # los pedimos mientras terminan de llegar los detalles
+    if include_videos:
+        details_result, latest_videos_results = await asyncio.gather(
+            details_task,
+            youtube_service.batch_get_channel_latest_videos(channel_ids, max_results=5)
+        )
+    else:
+        details_result = await details_task
+        latest_videos_results = [None] * len(channel_ids)
+
+    if not details_result['success']:
+        return {"error": f"Search failed: {details_result.get('error')}"}
+
+    if not details_result.get('channels'):
+        return {"error": "No channels found matching that name"}
+
+    # 🎬 Últimos videos de cada canal, por ID
+    latest_videos_by_id = dict(zip(channel_ids, latest_videos_results))
+
     # 📦 Construimos la respuesta con todos los canales encontrados
     channels_info = {
         'query': channel_name,
-        'total_results': search_result['total_results'],
+        'total_results': details_result['total_results'],
         'channels': []
     }
 
     # 📋 Agregamos la información de cada canal encontrado
-    for channel_data in search_result['channels']:
-        channel_info = {
-            'channel_id': channel_data['channel_id'],  # 🆔 ID del canal
-            'title': channel_data['title'],  # 📌 Nombre del canal
-            'description': channel_data['description'],  # 📄 Descripción
-            'url': channel_data['url'],  # 🔗 URL del canal
-            'thumbnail': channel_data['thumbnail'],  # 🖼️ Imagen del canal
-            # 📅 Fecha de creación
-            'published_at': channel_data['published_at'],
-            # � Estadísticas detalladas
-            # � Suscriptores
-            'subscriber_count': channel_data.get('subscriber_count', 0),
-            # � Total de videos
-            'video_count': channel_data.get('video_count', 0),
-            # � Vistas totales
-            'view_count': channel_data.get('view_count', 0),
-            'country': channel_data.get('country', 'N/A')  # 🌍 País del canal
-        }
+    for channel_data in details_result['channels']:
+        latest_videos_result = latest_videos_by_id[channel_data['channel_id']]
+        # 📋 channel_data ya tiene exactamente los campos que devolvemos
+        # (ver ChannelResult: ID, título, descripción, URL, miniatura, fecha,
+        # suscriptores, videos, vistas y país), así que lo copiamos de una vez.
+        # Copiamos en lugar de modificarlo porque el servicio lo guarda en caché
+        channel_info = dict(channel_data)
 
         # 🎬 Si el usuario lo pidió, añadimos los últimos videos del canal
-        if include_videos:
-            latest_videos_result = youtube_service.get_channel_latest_videos(
-                channel_id=channel_data['channel_id'],
-                max_results=5
-            )
-
-            if latest_videos_result.get('success'):
+        if latest_videos_result is not None:
+            if latest_videos_result['success']:
                 channel_info['latest_videos'] = latest_videos_result['videos']
             else:
                 # En caso de error, devolvemos la info básica del canal
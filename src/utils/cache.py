@@ -0,0 +1,77 @@
+"""
+🧠 Caché en memoria con tiempo de vida (TTL)
+
+Este módulo proporciona una caché sencilla para guardar resultados de llamadas
+costosas (como búsquedas en la API de YouTube) durante un tiempo limitado.
+Cada búsqueda repetida que sale de la caché ahorra una llamada de red y
+unidades de cuota de la API.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """⏱️ Caché LRU cuyas entradas caducan pasados ``ttl`` segundos.
+
+    - Si se supera ``maxsize``, se descarta la entrada usada hace más tiempo.
+    - Es thread-safe: se puede usar desde varias tools a la vez.
+
+    Ejemplo:
+        >>> cache = TTLCache(maxsize=1024, ttl=600)
+        >>> cache.set(("python", 5), {"success": True})
+        >>> cache.get(("python", 5))
+        {'success': True}
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """🔎 Devuelve el valor guardado o None si no existe o ha caducado."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                # ⌛ Entrada caducada: la eliminamos
+                del self._data[key]
+                return None
+
+            # 📌 Marcamos la entrada como usada recientemente
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """💾 Guarda un valor en la caché."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            # 🧹 Si nos pasamos del tamaño máximo, quitamos la más antigua
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """🗑️ Vacía la caché."""
+        with self._lock:
+            self._data.clear()
+
+
+def canon_topic(text: str) -> str:
+    """🔤 Forma canónica de un tema de búsqueda: minúsculas y espacios simples.
+
+    "  Python   Tutorial " y "python tutorial" son la misma búsqueda; usar
+    esta forma como clave hace que ambas compartan entrada en la caché.
+
+    Ejemplo:
+        >>> canon_topic("  Python   Tutorial ")
+        'python tutorial'
+    """
+    return " ".join(text.lower().split())
@@ -0,0 +1,111 @@
+"""
+💽 Caché persistente en disco
+
+Guarda pares clave -> valor (texto) en un archivo SQLite para datos que no
+cambian nunca, como el ID de la playlist de "uploads" de un canal. A
+diferencia de la caché en memoria (utils/cache.py), sobrevive a los
+reinicios del servidor: solo se pide a la API una vez por canal.
+
+Usa sqlite3 de la librería estándar, así que no añade dependencias.
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 📦 SQLite limita el número de parámetros por consulta
+_MAX_KEYS_PER_QUERY = 500
+
+
+class DiskCache:
+    """💽 Diccionario persistente (sin caducidad) respaldado por SQLite.
+
+    - El archivo se crea la primera vez que se usa, no al instanciar la clase.
+    - Si no se puede abrir o escribir (disco de solo lectura, permisos...),
+      se desactiva y se comporta como una caché vacía: nunca rompe la llamada.
+    - Es thread-safe.
+
+    Ejemplo:
+        >>> cache = DiskCache("~/.cache/youtube_mcp/uploads_playlists.db")
+        >>> cache.set_many({"UC123": "UU123"})
+        >>> cache.get_many(["UC123", "UC456"])
+        {'UC123': 'UU123'}
+    """
+
+    def __init__(self, path: Union[str, Path, Callable[[], Union[str, Path]]]):
+        """
+        Args:
+            path: Ruta del archivo, o una función que la devuelve. La función
+                  se llama al abrir la base de datos (el primer uso), así la
+                  ruta puede salir de variables de entorno que se cargan
+                  después de importar el módulo (p.ej. desde el .env).
+        """
+        self._path = path
+        self.path: Optional[Path] = None  # 📂 Ruta final, resuelta al abrir
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """🔌 Abre (una sola vez) la base de datos. Llamar con el lock tomado."""
+        if self._conn is None and not self._disabled:
+            try:
+                path = self._path() if callable(self._path) else self._path
+                self.path = Path(path).expanduser()
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS cache '
+                    '(key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+                )
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("⚠ Disk cache disabled (%s): %s", self.path, e)
+                self._disabled = True
+        return self._conn
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """🔎 Devuelve los valores guardados de ``keys`` (las que no están, se omiten)."""
+        keys = list(keys)
+        found: Dict[str, str] = {}
+        if not keys:
+            return found
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return found
+            try:
+                for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                    chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+                    placeholders = ','.join('?' * len(chunk))
+                    found.update(conn.execute(
+                        f'SELECT key, value FROM cache WHERE key IN ({placeholders})',
+                        chunk
+                    ))
+            except sqlite3.Error as e:
+                logger.warning("⚠ Could not read disk cache (%s): %s", self.path, e)
+        return found
+
+    def set_many(self, items: Dict[str, str]) -> None:
+        """💾 Guarda (o reemplaza) varios pares clave -> valor de una vez."""
+        if not items:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:  # 🔒 Una sola transacción para todos
+                    conn.executemany(
+                        'INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)',
+                        items.items()
+                    )
+            except sqlite3.Error as e:
+                logger.warning("⚠ Could not write disk cache (%s): %s", self.path, e)
@@ -3,21 +3,62 @@
 
 Este módulo centraliza la lógica de carga y conversión de iconos a base64
 para ser utilizados en servidores y tools de FastMCP.
+
+⚡ Los data URIs se precalculan en src/utils/icons_cache.py (generado con
+scripts/generate_icons_cache.py), así que en el caso normal cargar un icono
+es una simple búsqueda en un diccionario, sin leer ni codificar el PNG.
 """
 
-import base64
+import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 from mcp.types import Icon
+from utils.icons_cache import ICONS
+
+# 🚀 pybase64 usa instrucciones SIMD (SSSE3/AVX2/AVX-512) para codificar;
+# si no está instalado, usamos el base64 de la librería estándar.
+try:
+    from pybase64 import standard_b64encode
+except ImportError:
+    from base64 import standard_b64encode
+
+# 📂 Directorio de iconos (desde src/utils/ -> raíz/assets/icons/), calculado
+# una sola vez al importar. Es relativo a este paquete (nunca una ruta absoluta
+# fija), así funciona igual en local, en un devcontainer o desplegado.
+_ICONS_DIR = Path(__file__).parent.parent.parent / "assets" / "icons"
+
+# 📝 Logs a stderr (nunca a stdout: con el transporte stdio es el canal del protocolo)
+logger = logging.getLogger(__name__)
+
+
+def _read_icon_bytes(icon_filename: str) -> bytes:
+    """
+    📂 Lee los bytes de un icono de assets/icons/.
 
+    Raises:
+        FileNotFoundError: Si el icono no existe (el mensaje incluye la ruta)
+        OSError: Si no se puede leer
+    """
+    icon_path = _ICONS_DIR / icon_filename
+
+    # ⚡ Leemos directamente: si no existe, read_bytes() ya lanza
+    # FileNotFoundError (sin un stat() extra para comprobarlo antes)
+    return icon_path.read_bytes()
 
+
+@lru_cache(maxsize=None)
 def load_icon(icon_filename: str) -> List[Icon]:
     """
     🖼️ Carga un icono y retorna una lista para usar con FastMCP.
 
-    Lee el icono desde assets/icons/, lo convierte a base64 y retorna
-    una lista [Icon] lista para usar en servidores o tools.
-    Si hay error, retorna lista vacía [].
+    Busca el data URI precalculado en la caché de iconos. Si el icono no está
+    en la caché (p.ej. se añadió sin regenerarla), lo lee desde assets/icons/
+    y lo convierte a base64. Retorna una lista [Icon] lista para usar en
+    servidores o tools. Si hay error, retorna lista vacía [].
+
+    🧠 El resultado se memoiza por nombre de archivo: si varias tools usan el
+    mismo icono, se comparte la misma lista (no la modifiques).
 
     Args:
         icon_filename (str): Nombre del archivo (ej: "youtube.png")
@@ -36,26 +77,26 @@ def load_icon(icon_filename: str) -> List[Icon]:
         >>> def search_videos(topic: str):
         ...     pass
     """
-    try:
-        # 📂 Ruta al directorio de iconos (desde src/utils/ -> raíz/assets/icons/)
-        project_root = Path(__file__).parent.parent.parent
-        icon_path = project_root / "assets" / "icons" / icon_filename
-
-        # ✅ Verificar que existe
-        if not icon_path.exists():
-            raise FileNotFoundError(f"Icon not found at: {icon_path}")
+    # ⚡ Camino rápido: data URI precalculado en tiempo de build
+    # Como lo generamos nosotros, usamos model_construct() y nos saltamos
+    # la validación de Pydantic (que no aporta nada con datos de confianza)
+    cached_data_uri = ICONS.get(icon_filename)
+    if cached_data_uri is not None:
+        return [Icon.model_construct(src=cached_data_uri, mimeType="image/png", sizes=["64x64"])]
 
+    try:
         # 🔐 Leer y codificar en base64
-        icon_bytes = icon_path.read_bytes()
-        icon_base64 = base64.standard_b64encode(icon_bytes).decode()
+        icon_bytes = _read_icon_bytes(icon_filename)
 
         # 🌐 Crear data URI y objeto Icon
-        icon_data_uri = f"data:image/png;base64,{icon_base64}"
+        # Concatenamos en bytes y decodificamos una sola vez (ASCII)
+        icon_data_uri = (b"data:image/png;base64," +
+                         standard_b64encode(icon_bytes)).decode("ascii")
         icon = Icon(src=icon_data_uri, mimeType="image/png", sizes=["64x64"])
 
-        print(f"🖼️ Icon loaded: {icon_path}")
+        logger.debug("🖼️ Icon loaded: %s", icon_filename)
         return [icon]
 
-    except (FileNotFoundError, OSError) as e:
-        print(f"⚠ Warning: Could not load icon '{icon_filename}': {e}")
+    except OSError as e:
+        logger.warning("⚠ Could not load icon '%s': %s", icon_filename, e)
         return []
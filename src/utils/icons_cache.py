@@ -0,0 +1,13 @@
+"""
+🗃️ Caché precalculada de iconos (data URIs en base64)
+
+⚠️ Archivo generado automáticamente por scripts/generate_icons_cache.py.
+No lo edites a mano: vuelve a ejecutar el script si cambian los iconos.
+"""
+
+ICONS = {
+    "youtube-channel.png": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAB2HAAAdhwGP5fFlAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAABTxJREFUeJztm2lsFGUcxn/vO7vtsu2WtoSeiYGyJZz2A5ZDDCYkRiRFNBxGJcZvoOESLX6gagNVY0gRJEAQTxLkKEWwxQQlMVEiEuQDUA5hi0S0XNGW7ra0uzvz+kEKsr1oOzszJfyS/fKfmf/zvE/meOdYwS3O+/2JYeGdj+IFYAyQRP+iCTglBF8NiDRuHnrxYsu9bCQAfhtekBs12A+qIK4WreMkhl40+sKpP7pbUZz3+xPDJB25jwbfxklvtHF8d3uCDAvv/Ptw8ABjm1y+V7pbSaJ40Qo3diAQ3Y5NAqMs8GIXo9Wt81xnSCDZIjN24Dk2bpyrqxWkVU6cimkBeCYWklNdQXbVLnzznkO43Wa1jiumBZBeshwtJxtXbg6pyxaRvW8H3qJpILo8BG3HnACEQMvJvqukZWUyaGUJmV9uJrFgrCky8SDu54CEMaPI+Gwjgz5YiZadFW+5HmPNSVAIvE9MJbtyGwMXL0AkeS2RvRcsvQoITyIpL88jp6qC5OfngGb/RcgWBzJ1IGnFS8jauRXPY5PssHDHi53i7rwhDP5oNYM3fYjbn2eLB/v3QcAzoZDM7Z+TtqIYLT3NUm1HBAAgNI3kWTPJ+no7ngmFluk6JoA2pC+ZtBVvWKdnmZJDcVwARjBE/burLdPr8lbRSpSu07S3msZNn6D/U2+ZriMCaDlylIby9UQCFyzXtjWAyIWLNKzdQMuhw7Z5sCUAo+EGN7Z8QWhXJeiGHRZuY2kAqqWV4I4KGj/dimpqtlK6U6wJQCmaD/5Aw9qN6JevWCJ5r8Q9gHDNaRrK19N6/GS8pXqFOQEohV53+a6nQvqVqzRs3ELz/gOglCkybUS1BM7kTeFs3hTqMoYT9A4GIKXpOjnXzjLi958YWfsjmhHptpc45X/YFHeeiYWklyxHKUVoZyWhnXtQke4N9JSa/Kl8/+irNPi6frqU1ljHk4c2MOTvnxMeOXasUyOmBRBvDCn5bvJCDhfM7dF2mq6vGRlMLS4tFR1ebhw3Fe6MA5MX9XjwALqmLasZGHy/s+USCPXFmBXU5E/ll4I5vW8gWD57XePMjhZJ4HTvO8cfXbo5OGlB3xsp1swpVQmxZYlgW9+7x4/Twx6nPiXHjFZ5RmpoRmxRJqjmzSCOm6EQD84Mm2JaL4F6JrYm8wOB1iiqSAhOmKZkInUZI0zrpWBcbE0CFARO/OlWzeOFYClCHQWcMVEHQgMGmdZLCNodS7dngvmBQCuw7tbPMcx2JwYx6xsGRbs5T3+YB5h59/RXbKEfBKB+Na8V7Xo5PwAh95nY7JvYiuMDEPXJe4BAX/sowbl0b3JVbN3xAVSUijBKvNnHNkooXv94vmh3V+j4AAB2v+bbA5T3dnsl1Hu7l6ZUd7SsXwTwbGkgI9x4VYuGm3r8BDUaDqlw/bX8orJLuR0td/YXTMD0svMzpcFWUCkA0uXB7fEhpNbldsqIEmkJYkRb20pBIeRLVW/59/5/PUcH8PSq2iWGMspB3TVagUC4E9FcHqR0gdT+G4muYxgRjEgrRrS1o3mPAaK4+u38NXd6OZTpq84VSSX2xg7eBAxDMffbd4ZXgkMDKCq7lItx8wzgi5NEUJNy9L4S/yVHngSVcbOM+A0ewGcoYxU4cA+YUVr7kJJ6LfF/ZxE1pMvvvD1AYxbWvLFySUOf5bgAFMY0y8SEeMpxAaCw7Hs5hRrqvABQmdZJqSwHBmDdP1gEJDkxAEt5EIDdBuzmQQB2G7AbxwUg4LKFalccF4CuWKzgerx1FFw3lFr4L4P1k5cyj2peAAAAAElFTkSuQmCC",
+    "youtube-title.png": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAB2HAAAdhwGP5fFlAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAABc9JREFUeJzdmltsVEUYx38zu9vttsulbaC02IhNWxMuqQkBTNQXjQlGYmuQcn1oMYo+iIQIL2A0XGKUkKBElCBQTbg29QaIraIxmigSHwC5F2xIAxgNlN1u6e72nPHB1ljas+3umXNOy/9puzNnvu/33+nMme8cQY8ulZUFEyJnGYpFwFQgl5GlGHBGCPaGkpHtD7S2dg3lIgFwoaJyYrfJEVCVjqbonk5jGnOmXDlzdbCO4lJZWTBB7vF7CL5Xp3O6IzMHmwkyIXKW3YPwANNi/lEvD9ZJoljsRjZeSCAGZZPAZBdy8UpTVM86ZyUJhF1Kxgtl/zZ9uj9VB+lWJsNV2gzIfngGxYcbKDp0kFFL5iMCAV1DOyptBuSvXY2vuAj/xGLGrnyFoi/2kzNnNoiU/4KeS48BQuArLurzlW9CIQXr1lL48XaCldO0hHFCjq8BWVMnM37XNgreXoevaILT4dKWO4ugEOQ8+ThFjXsYs/wlRG6OK2GHIld3AZEdZHTtEooPNRBeOA983m9CKfdIpyTHjiFv1auE51bRvuV9un762bXYpe8uKpeoNzCJK1O96YkBvQqUTmLce5voOn6C9s1bSbZccTRe6dbF04RhHFOKcQBIUeH9HASyZ82gcN9u8taswpef50iMXnh64f/V8DAAQPh8hOdWMeGzfWTPmqF1bAt4kOwYNgb0So4Kk7fmNW3jvbCobLLoNr7pB4+sv7x83+vDzgCdupofJCJFE1DYt0XWX16xdykC5ekiOJDMaAe3Nm767+/2cIALE8PkxrvJjyYpiMQJJtWg41zND7K2ehKkgAePtsGBpAyD2OeHiXzwEcbNWwCcLQnzVk05sWxfn76j73STH01QEEkyLpLo+Zzo+Zyk0w/rnr6f9pDvrih94WGYGDDQNni2JMyGheV0Be6GgEjITyTkp3V8/7GUaWJ0xMG8e5b0hwePDUheaR3wRigVfCqlCw8eGWC23+b2jno6DjaCYfZpO18SZuMCffBS+o5dWr5nQHhw2QDVFSe6v4HIzk9Qsc5+7edLwqxfUM6dLE3wQT/+7ECjFTy4ZYBSdH77Pe1btmFcvzFgFyfgZSgLaajiVNc7bkDi97O0b95K/ORpyz5OwQMooe5LNYYeA5TCuHa9T1XIuPEn7dt20HmkCZT1vu0kPIAphAsGADc3vEP+2tUopeg40EjHgU9RyWTKa5yG75E7BnT9coJrc+YNuX+m8JjKAj6ADPWvRCuZegZ4chbIGB4wE90Wv7xFGV4RnrS7dqzVeBLoSDsLG7IDD/Qrs1tM+z4KGT7LWSCBs5llkr5swwMyy48MBhB+iQwFBoUHMAKqxHI8BHsyziYN6YAHQIAMBfCFs5HBIT59Mq0XQpmlOreDOGkvq9TSBp+hpLJeCGV5S0u8GzVHCE45EfxcSZh1C72DB1DCLLRqkwCVLafaAqpzphCsQKgTQP8b9Qx0riTM+gxOdfolzlu2OBWyYufSR4WPoyjP3z9o8udGnzlT05AYqNGRs8CD9c8/glJfDQP45lhu9Nk2C3hwYAb0wB8FRukeO001x3Kj1W01DXdSddJqwEiDB40GjER40GTASIUHDQaMZHiwuQuU7659CNTXeP+qXVMcs7qtpmFIL0j/XxnfoUzf/mIg4Vc/CIXX7700xTGrW+vq04YHG/WAWCD5nFCUZXq9JtmCBxsGKCGeyPRaTbIND3YqQv0eN7sqLfBgxwCh/rYbPENpgwdbBojvdCSQprTCgw0D/DnRBuAPXYkMQdrhwYYBZ2oaEgpzPppqB4PIEXiwWRa/WFd/QmHORjhaWW52Ch40nQUqdtc+JoR04vzfHMescgoeNJ4GHTDBcXjQXA/QaIIr8OBARUiDCa7Bg0NFURsmuAoPTlaF0zfBdXhw0ABIywRP4MHhx+MX6+p/VAZPAX9Z9VGCfV7Bg8MzoFdlu+rG+YVYqRRVCEqBDhS/IvnwQu2uL93IwUr/AJajrsD4aiOYAAAAAElFTkSuQmCC",
+    "youtube-videos.png": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAACdeAAAnXgHPwViOAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAABSNJREFUeJztm09sFFUcxz9vZtktXVratPzZLSaSUiAUEGkVLurBkGggHoyHJsQonvSkByOJB4NC9EAIRA0aY0pU4qWoieECiQcwEiJuNQISEY020NB2u92W3W13dmaeh22Hdmd2u9vO7izpfk677zfz5vt++f3e+703u1BjaSNmPuzYsaNJUZTdQogGLwWVGynlhBDiciQSGYdpB+zcufOAEOIE0OipusqRBN6KRCInRXd39x4p5TlmRcMSQQoh9qqhUOgMEPJajQcIYLMP2OpkVYGN6ADcxIeRa1ckW9uSAFy7E8QwcwJISJQ1Wbs5FARZlQG2zQcsy21djuQwSTZMD/svVN4hyOR0ltT7DT596RZbwikArt8J8tqX7aQ0NdvBMgP/czdRVmftcjhI+vsOyKgVGFNJ+BWn1r2krcEDdGCwD8363rNrxBo8QGdbkp5dUeu7um3YGjyAWJ3Et33EVeVu4eiAtUhb2xpM63Nbs2aztzWn73faaLeLhrStrRpwdMBv+Gxt/bPaLv9tXy0v3brfZt62242B6lxh1XA4fCi3cQAVHcE6DCYR9FHHefyW/Z+ROjKGwvpVU6Q0ld4f1/Jdf6tll7HlYCqI5inIqBj9IYwbqyoyoFIRXV1d9nhfQjimwFKi5gCvBXiN7+K64i5UO1cQ6AmXV40H1CJAbH+ouCsfbkWr31ReNR4gomPx2jK4lLHqW/PGVfS+015qyYspJVMbNtO0/xWbLfDF8RI7M8k8+Sxm+xZglgPk8BDGxR8Wp7QMJAyTmG5Qn5qkab/drv75e/GdaWnkWBTR2Q3t2Sb7rqdK0KQkmjGYMl2aolIJ5PgYyLn9VZ0DTCCmG9wzzFytCyceQ6YSjqaqcsBMuOtuDdwwkGMjoNnPJ2ZwzQGicSUykQAz9/RwflwPd7DyHaOwHteWQeXRx6j75CuUzZ1F32MCUd3gjqa7O/hUAjk6PO/gweU6QLRvJPDhKfxvvI2oDxa8NmGY3E5nmNBdzHXI5ns8Zpvs8uF+IaQoqPueJ3DqG9Q9e21mTUoGNZ3hjIu5Dtl8j97NO9nlo2yVoGhpxX/wXQJHjiPWhMoX7pDN9+jdgpNdPspeCiu7nyDQ20fqhRe5Zwp3wx1KyncnKrIMikAdq159nYann2Hw6HtM/nHNtb5TJ/oWdX9FN0N1HZsIHzyE2riyko8tSMUKIamlGTndS/R0L3IBuZoPX/9PJd9jrN+EbM4e47vmAF3KWW8O5pL89RcGjx5GG/jXrcdZ+M98XvzFUkJ8lPSBNzEefwpwwQEztbvQTepzbHpslKGTx4mfO1v0ulw2DB0Zi0JmbvQtygGza/c5WS0l8fNnGfroGHp8bDGPcIf0VLYsNk2baUEOKFS7awP/MXjsCMnIzwvp2n0SE8iJeF5zSQ4otFU1ptIMf/Yx0a9PIXV9IVLdZTrf5WSq4GVFO2C+rWri0gUSly6UpLFs5Ml3J+Z1QFm2quWkQL47kdcBZTmZKTfz5LsTjg5w/WSm3BSZ707MccADF+5QUr47Yb0ZMkeGSPRfQVZpvPtDYZY/0mVrV69cLLnIMjs6rVK49mrMawFes+QdYE2Cum4wOjqBdPiNYDXQsKKeYLDO9X6XfATUJkGvBXhNbQ5wvccHjNoc4LUAr1EA986oHzw0BbjutQoPuaoIwQdeq/AO+b7S0tTUB/IAMO61nAoyDvLl1ubmb63/ssVisZVSVXcjZXX+t8U9xjGMyy0tLRNeC6lRDfwPuoVYVN8OzRQAAAAASUVORK5CYII=",
+    "youtube.png": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAABYgAAAWIBXyfQUwAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAN7SURBVHic7drBbxVVFMfxz4xPni1VbGip1orGQDBCDYnBLquyZskSdpQddNE1sOEfYEOIq3ZJWLLEEIkSEmixojEUEItaRSgUG2ibkoyL26avtdra9s190vkmN5P7cmfO75w5c+fNvYeCgoKCgoKCgnVKshYXyXgF9Xh95ljGS3htwdBNSCv6dTPHiYrfnmN8wXmPK8Y9xZ8YT8LYVfGPAciC0G34EB/gDbRiC5pmxG8UnF6TQK6AKSEgYzPHx/gV9/ELvse3CSPLvmJGOaM7Yygje0Ha9YxDGS8v5XxbxpUaEFytdjXjnUqfkwrnN2MAW5edLv9PfsJHCY+YPyH1efGdh3fRO9tJIKMDVyIJisXHCVdnM+BQVClx6GLuEfgsopBYfArJzOT3QLx3eSwyNKd43/pznuDzjhTvxVYSkW0p2mKriMjWFM1VN7NrF62tVTezAppSYRKsLnv2cOsWJ05QV7fk8BzZnApfdtWnvp7jxxka4uBBkpqYd3PKgEra2ujt5eJFdu/O1fQiNKXCIkX+dHbS309fHy0tUSRgUyqs5sQhTTlwgNu3w/xQLuetoJwKy1dxaWgI88ONG+zfn6flDXEzYCHbt3P2LBcu0N6eh8UayYCF7N3LwABnztBc1b8pG2ozAFAq0dXFzZscPRr6a085XXpMZMplGhurFYCkJCwt11fj6qsiyzh3jp4e7t2rlpXJ2gzAtWsh7S9frralqVQIQG0wMsLhw3R05OE8TM1mQFwmJjh1ipMnGV+4K1ZVJkuYzNPi3zh/niNHuHs3hvWpFE9iWHb9evge2LcvlvMwluJhriZHR+nuDmsEly7lanoRHpYwmoup6WlOn+bYMZ7ESbpFGC3JIwMGB9m5M6wK1RY5ZcDAQNVNrJBHqVBIsF75OcWPsVVE5E6ShZKX+7GVRGJLmvAHhmMricBwwoPZz+Evo0qJw9fMbY9/HlFILOb7nPFFDRQx5dW+mvW7skiqBf14K7d7EIdRoUhqmIoiqSS8CT7BYBxduXATncm/TfoZdRk9GXdqIFXXqo1knMh4daG/S5XK7kC7UCr7tvCYvCmUxzYKpbIbVnNL1ogxPBNKZX/HbzPtB3yHbxKmFztx1Vu0WSg/bRCCslFYX5wtki6ZH/Xl7EWOm18EPWFu0eap4Oi4UDD9LAn9goKCgoKCgoKC/8pfE/1vrlVJXsAAAAAASUVORK5CYII=",
+}
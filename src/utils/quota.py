@@ -0,0 +1,104 @@
+"""
+🚦 Control de cuota y de ritmo de peticiones a la API
+
+La API de YouTube da a cada proyecto 10.000 unidades de cuota al día y cada
+llamada gasta unidades (``search.list`` 100, la mayoría del resto 1). Este
+módulo lleva la cuenta en local para dejar de lanzar peticiones que van a
+fallar con ``403 quotaExceeded`` y limita cuántas se envían por segundo,
+para que una ráfaga de llamadas no gaste la cuota de golpe.
+"""
+
+import threading
+import time
+
+
+class QuotaExceededError(Exception):
+    """🚫 No quedan unidades de cuota suficientes (según la cuenta local)."""
+
+
+class TokenBucket:
+    """🪣 Cubo de tokens: hasta ``capacity`` tokens que se rellenan a ``rate`` por segundo.
+
+    Es thread-safe: el servicio de YouTube se usa desde varios hilos a la vez.
+
+    Ejemplo:
+        >>> bucket = TokenBucket(capacity=50, rate=50)  # 50 por segundo
+        >>> bucket.try_acquire()
+        0.0
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """💧 Añade los tokens generados desde la última vez (llamar con el lock)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """🎟️ Intenta coger ``tokens`` del cubo.
+
+        Returns:
+            0 si se han cogido, o los segundos que faltan para que haya suficientes.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f'No se pueden pedir {tokens} tokens de un cubo de {self.capacity}')
+
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1) -> None:
+        """⏳ Coge ``tokens`` del cubo, esperando (bloqueando el hilo) si hace falta."""
+        while (wait := self.try_acquire(tokens)) > 0:
+            time.sleep(wait)
+
+    def drain(self) -> None:
+        """🕳️ Vacía el cubo (p.ej. cuando la API confirma que no queda cuota)."""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+
+class QuotaLimiter:
+    """🚦 Limita las peticiones por segundo y las unidades de cuota por día.
+
+    - Si no quedan unidades para una petición, falla en local con
+      :class:`QuotaExceededError` en lugar de gastar una llamada en un 403.
+    - Si se supera ``requests_per_second``, espera lo justo antes de enviar.
+
+    Ejemplo:
+        >>> quota = QuotaLimiter(daily_units=10000, requests_per_second=50)
+        >>> quota.acquire(100)  # 🔍 search.list
+    """
+
+    def __init__(self, daily_units: int = 10000, requests_per_second: float = 50):
+        # 📅 Las unidades se recuperan poco a poco a lo largo de 24 horas
+        self._units = TokenBucket(daily_units, daily_units / 86400)
+        self._requests = TokenBucket(requests_per_second, requests_per_second)
+
+    def acquire(self, cost: int) -> None:
+        """🎟️ Reserva ``cost`` unidades de cuota y un hueco para enviar una petición.
+
+        Raises:
+            QuotaExceededError: 🚫 Si no quedan unidades suficientes
+        """
+        wait = self._units.try_acquire(cost)
+        if wait > 0:
+            raise QuotaExceededError(
+                f'Cuota de la API agotada: faltan unos {wait:.0f} s '
+                f'para disponer de {cost} unidades'
+            )
+        self._requests.acquire()
+
+    def exhaust(self) -> None:
+        """🚫 Marca la cuota como agotada (la API ha respondido ``quotaExceeded``)."""
+        self._units.drain()